@@ -0,0 +1,141 @@
+import time
+
+
+
+class Animator:
+    """
+    Class that animates a sequence of steps on a Tk widget without blocking
+    it. The steps are run from callbacks scheduled with after(), so the
+    window keeps answering while the animation runs.
+
+    The speed is given in steps per second. On every frame the animator
+    runs the steps that are due since the animation started, so several
+    steps are batched in a frame when the speed is higher than the frame
+    rate, and the frames that arrive late are skipped by running their
+    steps in the next one. A frame never runs for longer than its share of
+    a second, so the window keeps the target frame rate even when the
+    steps are slow.
+    """
+
+    def __init__(self, widget, step, speed:float=10, fps:int=30):
+        """
+        Initializes the class instance.
+
+        Args:
+            widget (Widget): any Tk widget, used to schedule the frames.
+            step (callable): function called with every item to animate.
+            speed (float): steps per second.
+            fps (int): target frames per second.
+        """
+        self.widget = widget
+        self.step = step
+        self.fps = fps
+        self.items = None
+        self.job = None
+        self.on_done = None
+        self.set_speed(speed)
+
+
+    @property
+    def running(self) -> bool:
+        """
+        Returns:
+            bool: True while there is an animation in progress.
+        """
+        return self.items is not None
+
+
+    def play(self, items, on_done=None):
+        """
+        Starts animating a sequence of items, stopping the previous one.
+
+        Args:
+            items (iterable): the items to pass to the step function.
+            on_done (callable): function called without arguments when the
+                                animation ends or is skipped.
+        """
+        self.stop()
+        self.items = iter(items)
+        self.on_done = on_done
+        self._restart_clock()
+        self.job = self.widget.after(0, self._frame)
+
+
+    def set_speed(self, speed:float):
+        """
+        Changes the speed of the animation, also while it runs.
+
+        Args:
+            speed (float): steps per second.
+        """
+        self.speed = max(float(speed), 1e-3)
+        self._restart_clock()
+
+
+    def skip(self):
+        """
+        Runs all the remaining steps at once and ends the animation.
+        """
+        if self.items is None:
+            return
+        for item in self.items:
+            self.step(item)
+        self._finish()
+
+
+    def stop(self):
+        """
+        Cancels the animation without running the remaining steps.
+        """
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+        self.job = None
+        self.items = None
+        self.on_done = None
+
+
+    def _restart_clock(self):
+        """
+        Counts the due steps from now on, so a change of speed does not
+        make up for the time run at the previous one.
+        """
+        self.started = time.perf_counter()
+        self.done = 0
+
+
+    def _frame(self):
+        """
+        Runs the steps due at this moment, within the time of a frame, and
+        schedules the next frame.
+        """
+        self.job = None
+        now = time.perf_counter()
+        deadline = now + 1 / self.fps
+        # The first step is due at once and each other one a step later.
+        due = int((now - self.started) * self.speed) + 1
+
+        while self.done < due:
+            item = next(self.items, self)
+            if item is self:
+                self._finish()
+                return
+            self.step(item)
+            self.done += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        # Wait for the next step, but never longer than a frame, and at
+        # least a millisecond so Tk can redraw the window in between.
+        wait = self.done / self.speed - (time.perf_counter() - self.started)
+        wait = min(max(wait, 0.001), 1 / self.fps)
+        self.job = self.widget.after(int(wait * 1000) or 1, self._frame)
+
+
+    def _finish(self):
+        """
+        Ends the animation and calls the function of the end.
+        """
+        on_done = self.on_done
+        self.stop()
+        if on_done is not None:
+            on_done()
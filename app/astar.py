@@ -0,0 +1,89 @@
+from heapq import heappush, heappop
+
+from maze import Maze
+from tracer import Tracer
+from ucs import UCS
+
+
+
+class AStar(UCS):
+    """
+    Class that implements the A* search algorithm. It works like UCS but
+    orders the queue by the cost of the path plus an estimate of the cost
+    left to reach the goal, so it expands far fewer cells.
+
+    The estimate is the Manhattan distance to the goal multiplied by the
+    cheapest cost of entering a cell, which never overestimates the real
+    cost, so the path found is optimal.
+    """
+
+    def __init__(self, maze:Maze, tracer:Tracer|None=None):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+            tracer (Tracer): observer of the search, or None.
+        """
+        super().__init__(maze, tracer=tracer)
+        self.min_cost = maze.grid.min_cost()
+
+
+    def _search(self):
+        """
+        Implements the A* search algorithm. On equal estimates, the cell
+        with the most expensive path, that is the deepest, is taken out first.
+        Every expanded position is yielded.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+
+        queue = [(self._heuristic(self.start), 0, self.start)]
+        push = lambda position, cost: heappush(
+            queue, (cost + self._heuristic(position), -cost, position))
+        tracer = self.tracer
+        if tracer is not None:
+            push = self._traced(push, queue.__len__)
+
+        while queue:
+            _, current_cost, current = heappop(queue)
+            if current in self.visited:
+                continue
+            self._mark_visited(current)
+            if tracer is not None:
+                tracer.on_expand(current, -current_cost)
+            if self._is_goal(current):
+                if tracer is not None:
+                    tracer.on_goal(current)
+                break
+            self._relax_neighbors(current, -current_cost, push)
+            yield current
+
+        return self._backtrack()
+
+
+    def _heuristic(self, position:tuple[int, int]) -> int:
+        """
+        Estimates the cost of the path from a position to the goal.
+
+        Args:
+            position (tuple): a specific position within the maze.
+
+        Returns:
+            (int): the Manhattan distance to the goal scaled by the minimum cost.
+        """
+        distance = abs(position[0] - self.goal[0]) + abs(position[1] - self.goal[1])
+        return int(distance) * self.min_cost
+
+
+
+if __name__ == '__main__':
+
+    # Open the file with a matrix
+    maze = Maze('./data/matrix.txt')
+
+    # Find the path from the start to the goal
+    astar = AStar(maze)
+    print("Solution A*: ", astar.solve())
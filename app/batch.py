@@ -0,0 +1,200 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from maze import Maze
+from solvers import path_cost, solve
+from tracer import CounterTracer
+
+
+
+def solve_batch(mazes:list, algorithms:list[str], processes:int|None=None,
+                share_bytes:int=2**20):
+    """
+    Solves many mazes with several algorithms spreading the searches over a
+    pool of processes, and yields each result as soon as it is ready.
+
+    Mazes given as files are read by the workers. Mazes given as arrays of
+    at least share_bytes are copied once into shared memory, so they are
+    not pickled for every search; smaller ones are sent as they are. With a
+    single process the searches run in this one, in order, without a pool.
+
+    Args:
+        mazes (list): paths of maze files or numeric matrices.
+        algorithms (list): names of the algorithms to run on every maze.
+        processes (int): number of worker processes, all the cores by default.
+        share_bytes (int): minimum size of an array to use shared memory.
+
+    Yields:
+        (Dict): the maze (file or index in the list), the algorithm, the
+                path from the start to the goal, its cost, the number of
+                expanded and reached cells and the search time, or the
+                error raised.
+    """
+    processes = processes or os.cpu_count()
+    tasks = ((index, algorithm) for index in range(len(mazes)) for algorithm in algorithms)
+
+    if processes == 1:
+        for index, algorithm in tasks:
+            maze = mazes[index]
+            source = ('file', os.fspath(maze)) if isinstance(maze, (str, os.PathLike)) else ('array', maze)
+            yield _solve(_label(maze, index), source, algorithm)
+        return
+
+    # Shared memory blocks by maze, with the number of searches left.
+    blocks = {}
+    pending = {}
+
+    with ProcessPoolExecutor(processes) as pool:
+        try:
+            while True:
+                # Keep a few tasks per process in flight, so the shared
+                # memory of the mazes is only alive while they are solved.
+                for index, algorithm in tasks:
+                    source = _source(mazes[index], index, blocks, share_bytes, len(algorithms))
+                    future = pool.submit(_solve, _label(mazes[index], index), source, algorithm)
+                    pending[future] = index
+                    if len(pending) >= 4 * processes:
+                        break
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _release(pending.pop(future), blocks)
+                    yield future.result()
+        finally:
+            for block, _ in blocks.values():
+                block.close()
+                block.unlink()
+
+
+def _label(maze, index:int) -> str|int:
+    """
+    Returns how a maze is identified in the results.
+
+    Args:
+        maze (str|ndarray): path of a maze file or a numeric matrix.
+        index (int): position of the maze in the batch.
+
+    Returns:
+        (str|int): the path of the file or the index.
+    """
+    return maze if isinstance(maze, (str, os.PathLike)) else index
+
+
+def _source(maze, index:int, blocks:dict, share_bytes:int, uses:int) -> tuple:
+    """
+    Describes how a worker gets a maze: by its file, by its array or by the
+    name of its shared memory block, which is created the first time.
+
+    Args:
+        maze (str|ndarray): path of a maze file or a numeric matrix.
+        index (int): position of the maze in the batch.
+        blocks (dict): shared memory blocks by maze, with their uses left.
+        share_bytes (int): minimum size of an array to use shared memory.
+        uses (int): number of searches that will use the maze.
+
+    Returns:
+        (tuple): the kind of source followed by its data.
+    """
+    if isinstance(maze, (str, os.PathLike)):
+        return ('file', os.fspath(maze))
+
+    array = np.asarray(maze)
+    if array.nbytes < share_bytes:
+        return ('array', array)
+
+    if index not in blocks:
+        block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+        blocks[index] = [block, uses]
+
+    return ('shared', blocks[index][0].name, array.shape, array.dtype.str)
+
+
+def _release(index:int, blocks:dict):
+    """
+    Frees the shared memory of a maze when its last search is done.
+
+    Args:
+        index (int): position of the maze in the batch.
+        blocks (dict): shared memory blocks by maze, with their uses left.
+    """
+    if index in blocks:
+        blocks[index][1] -= 1
+        if blocks[index][1] == 0:
+            block, _ = blocks.pop(index)
+            block.close()
+            block.unlink()
+
+
+def _load(source:tuple) -> Maze:
+    """
+    Builds the maze of a task inside a worker.
+
+    Args:
+        source (tuple): the kind of source followed by its data.
+
+    Returns:
+        (Maze): Maze instance that represents the board.
+    """
+    kind = source[0]
+    if kind == 'file':
+        return Maze(source[1])
+    if kind == 'array':
+        return Maze('', matrix=source[1])
+
+    _, name, shape, dtype = source
+    # The block belongs to the parent process, which removes it.
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return Maze('', matrix=np.ndarray(shape, dtype, buffer=block.buf))
+    finally:
+        block.close()
+
+
+def _solve(label:str|int, source:tuple, algorithm:str) -> dict:
+    """
+    Runs one search inside a worker.
+
+    Args:
+        label (str|int): how the maze is identified in the results.
+        source (tuple): the kind of source followed by its data.
+        algorithm (str): name of the algorithm.
+
+    Returns:
+        (Dict): the result of the search.
+    """
+    result = {'maze': label, 'algorithm': algorithm}
+    # The visited positions of some algorithms are the reached ones, so the
+    # expansions are counted by a tracer, like in the benchmark.
+    counter = CounterTracer()
+    try:
+        maze = _load(source)
+        start = time.perf_counter()
+        solution = solve(maze, algorithm, counter)
+        result['time'] = time.perf_counter() - start
+    except Exception as error:
+        result['error'] = f'{type(error).__name__}: {error}'
+        return result
+
+    path = solution.path if solution.found else None
+    result['path'] = None if path is None else [(int(row), int(col)) for row, col in reversed(path)]
+    result['cost'] = path_cost(maze, solution.path)
+    result['expanded'] = counter.expanded
+    result['reached'] = len(solution.visited)
+    return result
+
+
+
+if __name__ == '__main__':
+
+    # Solve all the mazes of the data folder with BFS, UCS and A*.
+    files = sorted(os.path.join('./data', name) for name in os.listdir('./data'))
+    for result in solve_batch(files, ['bfs', 'ucs', 'astar']):
+        print(result['maze'], result['algorithm'], result.get('cost'), result.get('error', ''))
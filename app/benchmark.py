@@ -0,0 +1,281 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from generator import COST_MIXES, MazeGenerator
+from maze import Maze
+from solvers import ALGORITHMS, path_cost
+from tracer import CounterTracer
+from ucs import UCS
+
+
+
+# Sides of the square mazes of the suite.
+SIZES = [10, 100, 500, 1000, 2000, 4000]
+
+# Algorithms run by default: BFS, BFS in zigzag, UCS and IDS.
+DEFAULT_ALGORITHMS = ['bfs', 'bfs_zigzag', 'ucs', 'ids']
+
+
+def weighted_maze(rows:int, cols:int, walls:float=0.2, seed:int=0,
+                  costs:str='mixed', solvable:bool=True) -> Maze:
+    """
+    Creates a random maze with walls and cells of every cost. Pinocchio is
+    placed on the top left corner and Gepetto on the bottom right one.
+
+    Args:
+        rows (int): number of rows of the maze.
+        cols (int): number of columns of the maze.
+        walls (float): probability of a cell being a wall.
+        seed (int): seed of the random generator.
+        costs (str): name of the mix of costs, one of COST_MIXES.
+        solvable (bool): True to carve a random monotone path from the
+                         start to the goal, so there is always a solution.
+
+    Returns:
+        (Maze): the generated maze.
+    """
+    generator = MazeGenerator(seed, walls, COST_MIXES[costs])
+    matrix = generator.fill(rows, cols, (0, 0), (rows - 1, cols - 1), solvable)
+    return Maze('', matrix=matrix)
+
+
+def measure(maze:Maze, algorithm:str, memory:bool=True, repeat:int=1) -> dict:
+    """
+    Runs an algorithm on a maze and measures it. The time is the best of
+    the runs without a tracer or memory tracing, since both slow the search
+    down, so the expanded cells are counted and the memory is measured in
+    runs of their own.
+
+    The padded grid of the maze is shared by all the solvers, so it is built
+    before the runs and its size is reported on its own: the peak memory is
+    the one of the search alone.
+
+    Args:
+        maze (Maze): the maze to solve.
+        algorithm (str): name of the algorithm, one of ALGORITHMS.
+        memory (bool): True to run it again to measure its peak memory.
+        repeat (int): number of timed runs.
+
+    Returns:
+        (Dict): the time, the expanded cells, the expanded cells per
+                second, the reached cells, the peak memory and the size of
+                the grid in bytes, and the cost of the path.
+    """
+    cls, method = ALGORITHMS[algorithm]
+    grid = maze.grid
+
+    elapsed = float('inf')
+    for _ in range(repeat):
+        solver = cls(maze)
+        start = time.perf_counter()
+        path = getattr(solver, method)()
+        elapsed = min(elapsed, time.perf_counter() - start)
+        reached = len(solver.visited_list)
+        del solver
+
+    # The visited positions of some algorithms are the reached ones, so the
+    # expansions are counted by a tracer.
+    counter = CounterTracer()
+    getattr(cls(maze, tracer=counter), method)()
+    expanded = counter.expanded
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        getattr(cls(maze), method)()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'time': elapsed,
+        'expanded': expanded,
+        'expanded_per_second': expanded / elapsed if elapsed else None,
+        'reached': reached,
+        'peak_memory': peak,
+        'grid_memory': grid.nbytes,
+        'cost': path_cost(maze, path),
+    }
+
+
+def run_suite(sizes:list[int], algorithms:list[str], walls:list[float],
+              costs:list[str], seed:int=0, memory:bool=True, repeat:int=1):
+    """
+    Runs every algorithm on a seeded maze of every size, wall density and
+    mix of costs.
+
+    Args:
+        sizes (list): sides of the square mazes.
+        algorithms (list): names of the algorithms.
+        walls (list): probabilities of a cell being a wall.
+        costs (list): names of the mixes of costs.
+        seed (int): seed of the random generator.
+        memory (bool): True to measure the peak memory.
+        repeat (int): number of timed runs of each case.
+
+    Yields:
+        (Dict): the parameters of each case and its measures.
+    """
+    for size in sizes:
+        for density in walls:
+            for mix in costs:
+                maze = weighted_maze(size, size, density, seed, mix)
+                for algorithm in algorithms:
+                    case = {
+                        'algorithm': algorithm, 'size': size, 'walls': density,
+                        'costs': mix, 'seed': seed,
+                    }
+                    yield {**case, **measure(maze, algorithm, memory, repeat)}
+
+
+def compare(results:list[dict], baseline:list[dict], tolerance:float=0.1) -> list[str]:
+    """
+    Compares the results of a run with the ones of a baseline.
+
+    Args:
+        results (list): results of the current run.
+        baseline (list): results of the baseline run.
+        tolerance (float): relative increase of the time or the memory
+                           allowed before it is a regression.
+
+    Returns:
+        (List): description of each regression found.
+    """
+    case = lambda result: tuple(result[key] for key in ('algorithm', 'size', 'walls', 'costs', 'seed'))
+    previous = {case(result): result for result in baseline}
+    regressions = []
+
+    for result in results:
+        old = previous.get(case(result))
+        if old is None:
+            continue
+
+        name = '{} {}x{} walls={} costs={} seed={}'.format(
+            result['algorithm'], result['size'], result['size'],
+            result['walls'], result['costs'], result['seed'])
+
+        for key in ('time', 'peak_memory', 'grid_memory'):
+            if result.get(key) and old.get(key) and result[key] > old[key] * (1 + tolerance):
+                regressions.append(f'{name}: {key} went from {old[key]:.6g} to {result[key]:.6g}')
+
+        if result['cost'] != old['cost']:
+            regressions.append(f"{name}: path cost went from {old['cost']} to {result['cost']}")
+
+    return regressions
+
+
+def bench_ucs(sizes:list[int], walls:float=0.2, seed:int=0) -> list[dict]:
+    """
+    Times every queue of UCS on square weighted mazes.
+
+    Args:
+        sizes (list): side of each maze.
+        walls (float): probability of a cell being a wall.
+        seed (int): seed of the random generator.
+
+    Returns:
+        (List): one result per maze and queue.
+    """
+    results = []
+    for size in sizes:
+        maze = weighted_maze(size, size, walls, seed)
+        for engine in UCS.ENGINES:
+            ucs = UCS(maze, engine)
+            start = time.perf_counter()
+            path = ucs.solve()
+            elapsed = time.perf_counter() - start
+            results.append({
+                'size': size,
+                'engine': engine,
+                'time': elapsed,
+                'reached': len(ucs.visited_list),
+                'cost': path_cost(maze, path),
+            })
+    return results
+
+
+def _environment() -> dict:
+    """
+    Returns:
+        (Dict): the versions and the machine the benchmark runs on.
+    """
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Benchmark of the search algorithms.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the suite and save the results')
+    run.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    run.add_argument('--algorithms', nargs='+', choices=list(ALGORITHMS), default=DEFAULT_ALGORITHMS)
+    run.add_argument('--walls', type=float, nargs='+', default=[0.1, 0.3])
+    run.add_argument('--costs', nargs='+', choices=list(COST_MIXES), default=list(COST_MIXES))
+    run.add_argument('--seed', type=int, default=0)
+    run.add_argument('--no-memory', action='store_true', help='do not measure the peak memory')
+    run.add_argument('--repeat', type=int, default=1, help='timed runs of each case, the best is kept')
+    run.add_argument('--output', default='benchmark.json')
+    run.add_argument('--baseline', help='results to compare with')
+    run.add_argument('--tolerance', type=float, default=0.1)
+
+    check = commands.add_parser('compare', help='compare two saved results')
+    check.add_argument('results')
+    check.add_argument('baseline')
+    check.add_argument('--tolerance', type=float, default=0.1)
+
+    ucs = commands.add_parser('ucs', help='compare the queues of UCS')
+    ucs.add_argument('--sizes', type=int, nargs='+', default=[100, 300, 1000])
+    ucs.add_argument('--walls', type=float, default=0.2)
+    ucs.add_argument('--seed', type=int, default=0)
+
+    args = parser.parse_args()
+
+    if args.command == 'ucs':
+        print(f"{'size':>6} {'engine':>9} {'time (s)':>10} {'reached':>10} {'cost':>8}")
+        for result in bench_ucs(args.sizes, args.walls, args.seed):
+            print(f"{result['size']:>6} {result['engine']:>9} {result['time']:>10.3f}"
+                  f" {result['reached']:>10} {str(result['cost']):>8}")
+        sys.exit()
+
+    if args.command == 'run':
+        results = []
+        print(f"{'algorithm':>12} {'size':>6} {'walls':>6} {'costs':>8} {'time (s)':>10}"
+              f" {'cells/s':>10} {'memory (MB)':>12} {'grid (MB)':>10} {'cost':>8}")
+        suite = run_suite(args.sizes, args.algorithms, args.walls, args.costs,
+                          args.seed, not args.no_memory, args.repeat)
+        for result in suite:
+            results.append(result)
+            memory = '-' if result['peak_memory'] is None else f"{result['peak_memory'] / 2**20:.1f}"
+            print(f"{result['algorithm']:>12} {result['size']:>6} {result['walls']:>6}"
+                  f" {result['costs']:>8} {result['time']:>10.3f}"
+                  f" {result['expanded_per_second'] or 0:>10.0f} {memory:>12}"
+                  f" {result['grid_memory'] / 2**20:>10.1f} {str(result['cost']):>8}")
+
+        with open(args.output, 'w') as file:
+            json.dump({'environment': _environment(), 'results': results}, file, indent=2)
+        baseline_file = args.baseline
+    else:
+        with open(args.results) as file:
+            results = json.load(file)['results']
+        baseline_file = args.baseline
+
+    if baseline_file:
+        with open(baseline_file) as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print('REGRESSION', regression)
+        sys.exit(1 if regressions else 0)
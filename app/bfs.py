@@ -2,6 +2,8 @@ from collections import deque
 
 from constant import Constant
 from maze import Maze
+from stream import run, stream
+from tracer import Tracer
 
 
 
@@ -12,16 +14,23 @@ class BFS(Constant):
     exists), but it does not guarantee that the result is optimal.
     """
 
-    def __init__(self, maze:Maze):
+    # Define the possible moves: ↑, →, ↓, ←, and the reverse order.
+    MOVES = ((-1, 0), (0, 1), (1, 0), (0, -1))
+    MOVES_REVERSED = MOVES[::-1]
+
+    def __init__(self, maze:Maze, tracer:Tracer|None=None):
         """
         Initializes the class instance.
 
         Args:
             maze (Maze): Maze instance that represents the board.
+            tracer (Tracer): observer of the search, or None.
         """
         self.maze = maze.maze
         self.start = maze.start
         self.goal = maze.goal
+        self.cells, self.width = maze.grid.cells, maze.grid.width
+        self.tracer = tracer
 
 
     def solve(self) -> list|str:
@@ -29,6 +38,50 @@ class BFS(Constant):
         Implements the BFS algorithm.This implementation avoids returning
         to already visited nodes.
 
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        return run(self._search())
+
+
+    def solve_zigzag(self) -> list|str:
+        """
+        Implements the BFS algorithm in a zigzag pattern. For this, it
+        uses a list and takes out the nodes from the extreme left or right
+        depending on the level.
+
+        This implementation avoids returning to already visited nodes.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        return run(self._search_zigzag())
+
+
+    def iterate(self):
+        """
+        Runs the BFS algorithm step by step.
+
+        Yields:
+            (tuple): the events of the search, see stream.stream.
+        """
+        return stream(self, self._search())
+
+
+    def iterate_zigzag(self):
+        """
+        Runs the BFS algorithm in a zigzag pattern step by step.
+
+        Yields:
+            (tuple): the events of the search, see stream.stream.
+        """
+        return stream(self, self._search_zigzag())
+
+
+    def _search(self):
+        """
+        Searches level by level, yielding every expanded position.
+
         Returns:
             (List): path from the start position to the end position.
         """
@@ -38,26 +91,29 @@ class BFS(Constant):
         self._add_to_queue(self.start)
         self._mark_visited(self.start)
 
+        tracer = self.tracer
         level = 0
 
         while self.queue:
             current = self.queue.popleft()
             if self.levels[current] > level:
                 level = self.levels[current]
+            if tracer is not None:
+                tracer.on_expand(current, level)
             if self._is_goal(current):
+                if tracer is not None:
+                    tracer.on_goal(current)
                 break
             self._explore_neighbors(current, level)
-            print(current)
+            yield current
+
         return self._backtrack()
 
 
-    def solve_zigzag(self) -> list|str:
+    def _search_zigzag(self):
         """
-        Implements the BFS algorithm in a zigzag pattern. For this, it
-        uses a list and takes out the nodes from the extreme left or right
-        depending on the level.
-
-        This implementation avoids returning to already visited nodes.
+        Searches level by level changing the direction on every level,
+        yielding every expanded position.
 
         Returns:
             (List): path from the start position to the end position.
@@ -66,6 +122,7 @@ class BFS(Constant):
         self._add_to_queue(self.start)
         self._mark_visited(self.start)
 
+        tracer = self.tracer
         direction = 1  # 1 for left to right, -1 for right to left.
         level = 0
 
@@ -76,10 +133,14 @@ class BFS(Constant):
                 level = self.levels[current]
                 direction *= -1
             current = self.queue.popleft() if direction == 1 else self.queue.pop()
-            print(f'{current} ({direction})')
+            if tracer is not None:
+                tracer.on_expand(current, level)
             if self._is_goal(current):
+                if tracer is not None:
+                    tracer.on_goal(current)
                 break
             self._explore_neighbors(current, level, direction)
+            yield current
 
         return self._backtrack()
 
@@ -121,11 +182,7 @@ class BFS(Constant):
                          1 or None: from left to right.
                         -1: from right to left.
         """
-        # Define the possible moves: ↑, →, ↓, ←
-        if dir == None or dir == 1:
-            moves = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-        else:
-            moves = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+        moves = self.MOVES if dir == None or dir == 1 else self.MOVES_REVERSED
 
         for move in moves:
             # Calculates the next position according to the movement.
@@ -153,10 +210,8 @@ class BFS(Constant):
                   matrix, it hasn't been visited and it's not a wall.
         """
         return (
-            (0 <= position[0] < self.maze.shape[0])
-            and (0 <= position[1] < self.maze.shape[1])
-            and position not in self.visited
-            and self.maze[position] != self.WALL
+            position not in self.visited
+            and self.cells[(position[0] + 1) * self.width + position[1] + 1]
         )
 
 
@@ -189,6 +244,9 @@ class BFS(Constant):
         else:
             self.queue.appendleft(position)
 
+        if self.tracer is not None:
+            self.tracer.on_push(position, len(self.queue))
+
 
     def _set_parent(self, child:tuple[int, int], parent:tuple[int, int]):
         """
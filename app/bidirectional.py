@@ -0,0 +1,291 @@
+from collections import deque
+from heapq import heappush, heappop
+from math import inf
+
+from constant import Constant
+from maze import Maze
+from stream import run, stream
+from tracer import Tracer
+
+
+
+class Bidirectional(Constant):
+    """
+    Base class for the searches that run at the same time from Pinocchio
+    (forward) and from Gepetto (backward) and stop when both meet. The
+    index 0 of every pair of structures belongs to the forward search and
+    the index 1 to the backward one.
+    """
+
+    # Define the possible moves: ↑, →, ↓, ←
+    MOVES = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+    def __init__(self, maze:Maze, tracer:Tracer|None=None):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+            tracer (Tracer): observer of the search, or None.
+        """
+        self.maze = maze.maze
+        self.start = maze.start
+        self.goal = maze.goal
+        self.cells, self.width = maze.grid.cells, maze.grid.width
+        self.tracer = tracer
+
+
+    def solve(self) -> list|str:
+        """
+        Runs both searches until they meet.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        return run(self._search())
+
+
+    def iterate(self):
+        """
+        Runs both searches step by step.
+
+        Yields:
+            (tuple): the events of the search, see stream.stream.
+        """
+        return stream(self, self._search())
+
+
+    def _initialize(self):
+        """
+        Initializes the parent dictionaries of both searches and the list
+        with the order in which the cells were visited by any of them.
+        """
+        self.parents = ({self.start: None}, {self.goal: None})
+        self.visited_list = [self.start, self.goal]
+        self.meeting = None
+
+
+    def _neighbors(self, position:tuple[int, int]):
+        """
+        Generates the neighboring cells of a given position that are inside
+        the maze and are not walls.
+
+        Args:
+            position (tuple): a specific position within the maze.
+
+        Yields:
+            (tuple): the position of a neighbor.
+        """
+        for move in self.MOVES:
+            next_pos = (position[0] + move[0], position[1] + move[1])
+            if self.cells[(next_pos[0] + 1) * self.width + next_pos[1] + 1]:
+                yield next_pos
+
+
+    def _mark_visited(self, position:tuple[int, int], side:int):
+        """
+        Adds a position to the visited list unless the other search has
+        already visited it.
+
+        Args:
+            position (tuple): a specific position within the maze.
+            side (int): 0 for the forward search, 1 for the backward one.
+        """
+        if position not in self.parents[1 - side]:
+            self.visited_list.append(position)
+
+
+    def _backtrack(self) -> list|str:
+        """
+        Joins the path from the goal to the meeting cell of the backward
+        search with the path from the meeting cell to the start of the
+        forward search.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        if self.meeting is None:
+            return 'No existe una solución'
+        if self.tracer is not None:
+            self.tracer.on_goal(self.goal)
+
+        forward, backward = self.meeting
+
+        path = []
+        current = backward
+        while current is not None:
+            path.append(current)
+            current = self.parents[1][current]
+        path.reverse()
+
+        current = forward
+        while current is not None:
+            if current != backward:
+                path.append(current)
+            current = self.parents[0][current]
+
+        return path
+
+
+
+class BidirectionalBFS(Bidirectional):
+    """
+    Class that implements a bidirectional Breadth-First Search. It expands
+    a whole level of the smaller frontier at a time and stops at the end of
+    the level in which both searches meet, so the path has the fewest moves.
+    """
+
+    def _search(self):
+        """
+        Implements the bidirectional BFS algorithm, yielding every expanded
+        position.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+
+        while self.queues[0] and self.queues[1] and self.meeting is None:
+            side = 0 if len(self.queues[0]) <= len(self.queues[1]) else 1
+            yield from self._expand_level(side)
+
+        return self._backtrack()
+
+
+    def _initialize(self):
+        """
+        Initializes the queues and the levels of both searches.
+        """
+        super()._initialize()
+        self.queues = (deque([self.start]), deque([self.goal]))
+        self.levels = ({self.start: 0}, {self.goal: 0})
+
+
+    def _expand_level(self, side:int):
+        """
+        Expands all the cells of the current level of one of the searches and
+        keeps the shortest connection found with the other one. Every
+        expanded position is yielded.
+
+        Args:
+            side (int): 0 for the forward search, 1 for the backward one.
+        """
+        queue, parent, level = self.queues[side], self.parents[side], self.levels[side]
+        other_level = self.levels[1 - side]
+        best = inf
+        tracer = self.tracer
+
+        for _ in range(len(queue)):
+            current = queue.popleft()
+            if tracer is not None:
+                tracer.on_expand(current, level[current])
+            for next_pos in self._neighbors(current):
+                if next_pos in other_level:
+                    length = level[current] + 1 + other_level[next_pos]
+                    if length < best:
+                        best = length
+                        self.meeting = (current, next_pos) if side == 0 else (next_pos, current)
+                if next_pos not in parent:
+                    self._mark_visited(next_pos, side)
+                    parent[next_pos] = current
+                    level[next_pos] = level[current] + 1
+                    queue.append(next_pos)
+                    if tracer is not None:
+                        tracer.on_push(next_pos, len(self.queues[0]) + len(self.queues[1]))
+            yield current
+
+
+
+class BidirectionalUCS(Bidirectional):
+    """
+    Class that implements a bidirectional Uniform-Cost Search. The forward
+    search keeps the cost from the start to each cell (cost_so_far) and the
+    backward one the cost from each cell to the goal (cost_to_goal). It
+    stops when the sum of the lowest costs of both queues is not below the
+    cost of the best path found, so the path is optimal.
+    """
+
+    def _search(self):
+        """
+        Implements the bidirectional Uniform-Cost Search algorithm, yielding
+        every expanded position.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+        queues = self.queues
+
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= self.best:
+                break
+
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            current_cost, current = heappop(queues[side])
+            if current in self.settled[side]:
+                continue
+            self.settled[side].add(current)
+            if self.tracer is not None:
+                self.tracer.on_expand(current, current_cost)
+            self._relax_neighbors(current, current_cost, side)
+            yield current
+
+        return self._backtrack()
+
+
+    def _initialize(self):
+        """
+        Initializes the queues, the settled sets and the costs of both searches.
+        """
+        super()._initialize()
+        self.queues = ([(0, self.start)], [(0, self.goal)])
+        self.settled = (set(), set())
+        self.costs = ({self.start: 0}, {self.goal: 0})
+        self.cost_so_far, self.cost_to_goal = self.costs
+        self.best = inf
+
+
+    def _relax_neighbors(self, current:tuple[int, int], current_cost:int, side:int):
+        """
+        Updates the cost of the neighbors of a cell in one of the searches and
+        checks if they connect with the other one through a cheaper path.
+
+        Args:
+            current (tuple): a specific position within the maze.
+            current_cost (int): the cost of the path to reach this position.
+            side (int): 0 for the forward search, 1 for the backward one.
+        """
+        cost, other_cost = self.costs[side], self.costs[1 - side]
+
+        for next_pos in self._neighbors(current):
+            if next_pos in self.settled[side]:
+                continue
+
+            # A move costs the value of the cell it enters, which is the
+            # neighbor going forward and the current cell going backward.
+            step = next_pos if side == 0 else current
+            new_cost = current_cost + self.cells[(step[0] + 1) * self.width + step[1] + 1] - 1
+
+            if new_cost < cost.get(next_pos, inf):
+                if next_pos not in cost:
+                    self._mark_visited(next_pos, side)
+                cost[next_pos] = new_cost
+                self.parents[side][next_pos] = current
+                heappush(self.queues[side], (new_cost, next_pos))
+                if self.tracer is not None:
+                    self.tracer.on_push(next_pos, len(self.queues[0]) + len(self.queues[1]))
+
+                if next_pos in other_cost and new_cost + other_cost[next_pos] < self.best:
+                    self.best = new_cost + other_cost[next_pos]
+                    self.meeting = (next_pos, next_pos)
+
+
+
+if __name__ == '__main__':
+
+    # Open the file with a matrix
+    maze = Maze('./data/matrix.txt')
+
+    # Find the path from the start to the goal
+    print("Solution BFS bidireccional: ", BidirectionalBFS(maze).solve())
+    print("Solution UCS bidireccional: ", BidirectionalUCS(maze).solve())
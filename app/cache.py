@@ -0,0 +1,236 @@
+import hashlib
+import os
+import struct
+from collections import OrderedDict
+
+import numpy as np
+
+from maze import Maze
+from solvers import Result, solve
+
+
+
+class ResultCache:
+    """
+    Class that keeps the results of the searches, so solving again the same
+    maze with the same algorithm does not search again.
+
+    The results are identified by a hash of the content of the maze, the
+    algorithm and the start and goal positions. They are kept in memory in
+    a least recently used (LRU) order, dropping the oldest ones when their
+    total size goes over a limit, and optionally in a directory on disk.
+    Both tiers store the results in a compact binary format.
+    """
+
+    # Magic number, flags and lengths of the path, the visited list and the costs.
+    HEADER = struct.Struct('<4sBIII')
+    MAGIC = b'PRC1'
+    HAS_PATH = 1
+    HAS_COSTS = 2
+    NO_PATH = 'No existe una solución'
+
+    def __init__(self, max_bytes:int=64 * 2**20, directory:str|None=None):
+        """
+        Initializes the class instance.
+
+        Args:
+            max_bytes (int): maximum size of the results kept in memory.
+            directory (str): directory for the results on disk, or None to
+                             keep them only in memory.
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.memory = OrderedDict()
+        self.size = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+
+    def solve(self, maze:Maze, algorithm:str) -> Result:
+        """
+        Returns the result of a search from the cache, or runs the search
+        and keeps its result if it is not there.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+            algorithm (str): name of the algorithm.
+
+        Returns:
+            (Result): the path, the visited positions and the costs.
+        """
+        key = self.key(maze, algorithm)
+        result = self.get(key)
+        if result is None:
+            result = solve(maze, algorithm)
+            self.put(key, result)
+        return result
+
+
+    @staticmethod
+    def key(maze:Maze, algorithm:str) -> str:
+        """
+        Computes the key of the result of a search.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+            algorithm (str): name of the algorithm.
+
+        Returns:
+            (str): hexadecimal hash of the maze, the algorithm and the
+                   start and goal positions.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(struct.pack('<II', *maze.maze.shape))
+        # The bytes of the cells are hashed as they are stored, so mazes of
+        # different types never share a key.
+        digest.update(maze.maze.dtype.str.encode())
+        digest.update(np.ascontiguousarray(maze.maze))
+        digest.update(algorithm.encode())
+        digest.update(struct.pack('<4q', *maze.start, *maze.goal))
+        return digest.hexdigest()
+
+
+    def get(self, key:str) -> Result|None:
+        """
+        Looks for a result in memory and then on disk.
+
+        Args:
+            key (str): the key of the result.
+
+        Returns:
+            (Result): the result, or None if it is not in the cache.
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.decode(self.memory[key])
+
+        if self.directory is None:
+            return None
+
+        try:
+            with open(self._filename(key), 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        self._remember(key, data)
+        return self.decode(data)
+
+
+    def put(self, key:str, result:Result):
+        """
+        Keeps a result in memory and, if there is a directory, on disk.
+
+        Args:
+            key (str): the key of the result.
+            result (Result): the result of the search.
+        """
+        data = self.encode(result)
+        self._remember(key, data)
+
+        if self.directory is not None:
+            # Write to a temporary file first, so a file is never half written.
+            filename = self._filename(key)
+            with open(filename + '.tmp', 'wb') as file:
+                file.write(data)
+            os.replace(filename + '.tmp', filename)
+
+
+    def clear(self):
+        """
+        Removes all the results kept in memory.
+        """
+        self.memory.clear()
+        self.size = 0
+
+
+    def _remember(self, key:str, data:bytes):
+        """
+        Keeps an encoded result in memory and drops the least recently used
+        ones until the size is under the limit.
+
+        Args:
+            key (str): the key of the result.
+            data (bytes): the encoded result.
+        """
+        if key in self.memory:
+            self.size -= len(self.memory.pop(key))
+
+        if len(data) > self.max_bytes:
+            return
+
+        self.memory[key] = data
+        self.size += len(data)
+
+        while self.size > self.max_bytes:
+            _, oldest = self.memory.popitem(last=False)
+            self.size -= len(oldest)
+
+
+    def _filename(self, key:str) -> str:
+        """
+        Returns the path of the file of a result on disk.
+
+        Args:
+            key (str): the key of the result.
+
+        Returns:
+            (str): the path of the file.
+        """
+        return os.path.join(self.directory, key + '.res')
+
+
+    @classmethod
+    def encode(cls, result:Result) -> bytes:
+        """
+        Encodes a result in the binary format: a header followed by the
+        positions of the path, the visited positions, the positions with a
+        cost and the costs, all of them as 32-bit integers.
+
+        Args:
+            result (Result): the result of a search.
+
+        Returns:
+            (bytes): the encoded result.
+        """
+        path = result.path if result.found else []
+        costs = result.costs or {}
+        flags = (cls.HAS_PATH if result.found else 0) | (cls.HAS_COSTS if result.costs is not None else 0)
+
+        header = cls.HEADER.pack(cls.MAGIC, flags, len(path), len(result.visited), len(costs))
+        arrays = [
+            np.asarray(path, dtype='<i4').reshape(-1, 2),
+            np.asarray(result.visited, dtype='<i4').reshape(-1, 2),
+            np.asarray(list(costs), dtype='<i4').reshape(-1, 2),
+            np.asarray(list(costs.values()), dtype='<i4'),
+        ]
+        return header + b''.join(array.tobytes() for array in arrays)
+
+
+    @classmethod
+    def decode(cls, data:bytes) -> Result:
+        """
+        Decodes a result from the binary format.
+
+        Args:
+            data (bytes): the encoded result.
+
+        Returns:
+            (Result): the result of the search.
+        """
+        magic, flags, n_path, n_visited, n_costs = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError('The data is not an encoded search result')
+
+        values = np.frombuffer(data, dtype='<i4', offset=cls.HEADER.size)
+        sizes = np.cumsum([2 * n_path, 2 * n_visited, 2 * n_costs])
+        path, visited, cells, costs = np.split(values, sizes)
+
+        to_positions = lambda array: list(map(tuple, array.reshape(-1, 2).tolist()))
+
+        return Result(
+            path=to_positions(path) if flags & cls.HAS_PATH else cls.NO_PATH,
+            visited=to_positions(visited),
+            costs=dict(zip(to_positions(cells), costs.tolist())) if flags & cls.HAS_COSTS else None,
+        )
@@ -0,0 +1,87 @@
+import argparse
+import glob
+import json
+import os
+import sys
+
+from batch import solve_batch
+from mazeio import MazeIO
+from solvers import ALGORITHMS
+
+
+
+# Extensions of the maze files taken from a directory.
+EXTENSIONS = ('.txt', MazeIO.BINARY, '.npy')
+
+
+def find_mazes(patterns:list[str]) -> list[str]:
+    """
+    Expands the files, directories and glob patterns of the command line
+    into the paths of the maze files, keeping their order and without
+    repeating any of them.
+
+    Args:
+        patterns (list): paths of files or directories, or glob patterns.
+
+    Returns:
+        (List): paths of the maze files.
+    """
+    files = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        for match in matches:
+            if os.path.isdir(match):
+                files.update(dict.fromkeys(
+                    os.path.join(match, name) for name in sorted(os.listdir(match))
+                    if name.lower().endswith(EXTENSIONS)
+                ))
+            elif os.path.isfile(match):
+                files[match] = None
+            else:
+                print(f'No maze matches {pattern!r}', file=sys.stderr)
+    return list(files)
+
+
+def main(arguments:list[str]|None=None) -> int:
+    """
+    Solves the mazes given in the command line and writes a JSON line for
+    every maze and algorithm as soon as its search ends.
+
+    Args:
+        arguments (list): the arguments, the ones of the command line by default.
+
+    Returns:
+        (int): the exit status, 1 if a search failed and 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description='Solves mazes without a window, writing a JSON line per search.')
+    parser.add_argument('mazes', nargs='+', help='maze files, directories or glob patterns')
+    parser.add_argument('-a', '--algorithms', nargs='+', choices=list(ALGORITHMS), default=['bfs', 'ucs', 'astar'])
+    parser.add_argument('-p', '--processes', type=int, default=1, help='worker processes, 0 for all the cores')
+    parser.add_argument('-o', '--output', default='-', help='file for the results, the standard output by default')
+    parser.add_argument('--no-path', action='store_true', help='leave the paths out of the results')
+    args = parser.parse_args(arguments)
+
+    files = find_mazes(args.mazes)
+    if not files:
+        parser.error('no maze files found')
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    failed = False
+    try:
+        for result in solve_batch(files, args.algorithms, args.processes or None):
+            if args.no_path:
+                result.pop('path', None)
+            failed = failed or 'error' in result
+            output.write(json.dumps(result) + '\n')
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    return 1 if failed else 0
+
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
@@ -1,14 +1,20 @@
-import numpy as np
-
 import tkinter as tk
 from tkinter import messagebox
 
 from constant import Constant
+from generator import MazeGenerator
 
 from maze import Maze
 
 class Random(Constant):
-    
+
+    # Generation algorithm of each option of the dialog.
+    ALGORITHMS = {
+        'Relleno aleatorio': 'fill',
+        'Laberinto (backtracking)': 'backtracker',
+        'Laberinto (Kruskal)': 'kruskal',
+    }
+
     def __init__(self, parent):
         self.parent=parent
         self.master = tk.Tk()
@@ -17,14 +23,20 @@ class Random(Constant):
         tk.Label(self.master, text="Ingrese los datos").grid(row=0, column=0, columnspan=2)
         tk.Label(self.master, text="Filas:").grid(pady=5, row=1, column=0, sticky='nw')
         tk.Label(self.master, text="Columnas:").grid(pady=5, row=2, column=0, sticky='nw')
+        tk.Label(self.master, text="Tipo:").grid(pady=5, row=3, column=0, sticky='nw')
+        tk.Label(self.master, text="Semilla (opcional):").grid(pady=5, row=4, column=0, sticky='nw')
 
         self.rows = tk.Entry(self.master, width=20)
         self.rows.grid(padx=5, row=1, column=1)
         self.columns = tk.Entry(self.master, width=20)
         self.columns.grid(padx=5, row=2, column=1)
+        self.algorithm = tk.StringVar(self.master, value=next(iter(self.ALGORITHMS)))
+        tk.OptionMenu(self.master, self.algorithm, *self.ALGORITHMS).grid(padx=5, row=3, column=1, sticky='ew')
+        self.seed = tk.Entry(self.master, width=20)
+        self.seed.grid(padx=5, row=4, column=1)
 
-        tk.Button(self.master, text='Cancelar', command=self._destroy).grid(pady=10, row=3, column=0, sticky='nsew')
-        tk.Button(self.master, text="Aceptar", command=self._generate_matrix).grid(pady=10, row=3, column=1, sticky='nsew')
+        tk.Button(self.master, text='Cancelar', command=self._destroy).grid(pady=10, row=5, column=0, sticky='nsew')
+        tk.Button(self.master, text="Aceptar", command=self._generate_matrix).grid(pady=10, row=5, column=1, sticky='nsew')
 
         self.master.mainloop()
 
@@ -35,26 +47,25 @@ class Random(Constant):
         print(self.rows.get(), self.columns.get())
 
     def _generate_matrix(self):
-        values = [self.CIGAR, self.WALL, self.EMPTY, self.FOX]
         n = self.rows.get()
         m = self.columns.get()
+        seed = self.seed.get().strip()
 
-        if not str.isdigit(n) or not str.isdigit(m):
+        if not str.isdigit(n) or not str.isdigit(m) or (seed and not str.isdigit(seed)):
             messagebox.showerror(message="Debe ingresar números", title="Ocurrió un error")
             return
-        
+
         n = int(n)
         m = int(m)
-        new_matrix = np.random.choice(values, size=(n,m))
-        new_matrix[np.random.randint(0,n)][np.random.randint(0, m)] = self.PINOCCHIO
-
-        while True:
-            row_g = np.random.randint(0,n)
-            col_g = np.random.randint(0, m)
+        algorithm = self.ALGORITHMS[self.algorithm.get()]
+        if not MazeGenerator.fits(n, m, algorithm):
+            messagebox.showerror(message="El mapa no tiene lugar para Pinocchio y Gepetto, debe ser más grande",
+                                 title="Ocurrió un error")
+            return
 
-            if(new_matrix[row_g][col_g] != self.PINOCCHIO):
-                new_matrix[row_g][col_g] = self.GEPETTO
-                break
+        # The generated maps always have a path from Pinocchio to Gepetto.
+        generator = MazeGenerator(int(seed) if seed else None)
+        new_matrix = generator.generate(n, m, algorithm)
 
         self.parent.maze = Maze('', matrix=new_matrix)
         self.parent.matrix = self.parent.maze.matrix
@@ -0,0 +1,137 @@
+import numpy as np
+
+from constant import Constant
+
+
+
+class DistanceField(Constant):
+    """
+    Class that represents the distance from every cell of a maze to Gepetto
+    and the next move to take from each one to get closer to him.
+
+    It is built with a single backward search from the goal, a Dijkstra
+    when it is weighted or a BFS otherwise, so after that the path from any
+    start cell is found by following the next moves, in O(path length).
+
+    The search is level-synchronous: all the cells at the same distance are
+    relaxed at once with NumPy, using a bucket for each distance (Dial's
+    algorithm), since the cost of a move is a small integer.
+    """
+
+    def __init__(self, maze, weighted:bool=True):
+        """
+        Initializes the class instance and builds the field.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+            weighted (bool): True to use the cost of the cells, False to
+                             count the moves.
+        """
+        self.rows, self.cols = maze.maze.shape
+        self.goal = maze.goal
+        self.weighted = weighted
+
+        self._build(maze.grid)
+
+
+    def _build(self, grid):
+        """
+        Runs the backward search from the goal and stores the distance and
+        next-hop grids.
+
+        Args:
+            grid (Grid): the padded grid of the maze, with its adjacency.
+        """
+        width = grid.width
+
+        distance = np.full(grid.size, -1, dtype=np.int64)
+        next_hop = np.full(grid.size, -1, dtype=np.int8)
+
+        goal = grid.to_index(self.goal)
+        distance[goal] = 0
+        buckets = {0: [np.array([goal])]}
+        current = 0
+
+        while buckets:
+            while current not in buckets:
+                current += 1
+
+            # Moves from Pinocchio cost nothing, so the bucket can grow while
+            # it is being processed.
+            while buckets.get(current):
+                cells = np.concatenate(buckets.pop(current))
+                cells = np.unique(cells[distance[cells] == current])
+                if not len(cells):
+                    continue
+
+                # A cell is reached backward from its neighbors, and the move
+                # forward costs the value of the cell that is entered.
+                sources, moves, neighbors = grid.neighbors(cells)
+                if self.weighted:
+                    # The byte of a cell is its value plus one.
+                    new_distance = current - 1 + grid.codes[cells].astype(np.int64)[sources]
+                else:
+                    new_distance = np.full(len(sources), current + 1, dtype=np.int64)
+
+                valid = (distance[neighbors] < 0) | (new_distance < distance[neighbors])
+                neighbors, moves, new_distance = neighbors[valid], moves[valid], new_distance[valid]
+
+                # Keep the cheapest way of reaching each neighbor.
+                order = np.lexsort((new_distance, neighbors))
+                _, first = np.unique(neighbors[order], return_index=True)
+                keep = order[first]
+                neighbors, moves, new_distance = neighbors[keep], moves[keep], new_distance[keep]
+
+                distance[neighbors] = new_distance
+                # The next move goes back to the cell it was reached from.
+                next_hop[neighbors] = (moves + 2) % 4
+
+                for value in np.unique(new_distance):
+                    buckets.setdefault(int(value), []).append(neighbors[new_distance == value])
+
+            buckets.pop(current, None)
+
+        inner = (slice(1, -1), slice(1, -1))
+        self.distance = distance.reshape(self.rows + 2, width)[inner].astype(np.int32)
+        self.next_hop = next_hop.reshape(self.rows + 2, width)[inner].copy()
+
+
+    def cost(self, start:tuple[int, int]) -> int|None:
+        """
+        Returns the distance from a position to the goal.
+
+        Args:
+            start (tuple): a specific position within the maze.
+
+        Returns:
+            (int): the distance to the goal, or None if it is unreachable.
+        """
+        distance = int(self.distance[start])
+        return None if distance < 0 else distance
+
+
+    def path(self, start:tuple[int, int]) -> list|str:
+        """
+        Finds the path from a position to the goal following the next moves.
+
+        Args:
+            start (tuple): a specific position within the maze.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        if self.distance[start] < 0:
+            return 'No existe una solución'
+
+        # Define the possible moves: ↑, →, ↓, ←
+        moves = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+        current = (int(start[0]), int(start[1]))
+        path = [current]
+        while self.next_hop[current] >= 0:
+            move = moves[self.next_hop[current]]
+            current = (current[0] + move[0], current[1] + move[1])
+            path.append(current)
+
+        path.reverse()
+        return path
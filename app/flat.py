@@ -0,0 +1,326 @@
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+
+from constant import Constant
+from maze import Maze
+
+
+
+class FlatSearch(Constant):
+    """
+    Base class for the search engines that work on flat cell indices.
+
+    The searches run on the padded grid of the maze, so a cell is just an
+    integer and its neighbors are found by adding a fixed offset, without
+    bounds checks. The search state lives in preallocated buffers
+    (bytearray and array) instead of sets and dictionaries of tuples.
+    """
+
+    def __init__(self, maze:Maze):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+        """
+        grid = self.grid = maze.grid
+        self.rows, self.cols = grid.rows, grid.cols
+
+        # A wall is 0 and the cost of entering a cell is its value minus one.
+        self.cells = grid.cells
+        self.size = grid.size
+
+        self.start = grid.to_index(maze.start)
+        self.goal = grid.to_index(maze.goal)
+
+        # Define the possible moves: ↑, →, ↓, ←
+        self.offsets = grid.offsets
+
+
+    def _initialize(self):
+        """
+        Allocates the buffers with the visited flags, the parents and the
+        order in which the cells were visited.
+        """
+        self.visited = bytearray(self.size)
+        self.parent = array('i', [-1]) * self.size
+        self.order = array('i')
+
+
+    @property
+    def visited_list(self) -> list[tuple[int, int]]:
+        """
+        Returns:
+            (List): visited positions in the order they were reached.
+        """
+        return [self.grid.to_position(index) for index in self.order]
+
+
+    def _backtrack(self) -> list|str:
+        """
+        Backtrack from the goal to the start to find the path.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        if self.goal != self.start and self.parent[self.goal] == -1:
+            return 'No existe una solución'
+
+        path = []
+        current = self.goal
+
+        while current != self.start:
+            path.append(self.grid.to_position(current))
+            current = self.parent[current]
+
+        path.append(self.grid.to_position(self.start))
+
+        return path
+
+
+
+class FlatBFS(FlatSearch):
+    """
+    Breadth-First Search on flat cell indices. It expands the cells in the
+    same order as BFS, so it returns the same paths.
+    """
+
+    def solve(self) -> list|str:
+        """
+        Implements the BFS algorithm.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+
+        grid, visited, parent, order = self.cells, self.visited, self.parent, self.order
+        offsets, goal = self.offsets, self.goal
+
+        queue = deque([self.start])
+        visited[self.start] = 1
+        order.append(self.start)
+
+        while queue:
+            current = queue.popleft()
+            if current == goal:
+                break
+            for offset in offsets:
+                next_pos = current + offset
+                if not visited[next_pos] and grid[next_pos]:
+                    visited[next_pos] = 1
+                    order.append(next_pos)
+                    parent[next_pos] = current
+                    queue.append(next_pos)
+
+        return self._backtrack()
+
+
+    def solve_zigzag(self) -> list|str:
+        """
+        Implements the BFS algorithm in a zigzag pattern, taking out the
+        cells from the left or the right of the queue depending on the level.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+
+        grid, visited, parent, order = self.cells, self.visited, self.parent, self.order
+        goal = self.goal
+        forward = self.offsets
+        backward = self.offsets[::-1]
+
+        self.levels = levels = array('i', [0]) * self.size
+
+        queue = deque([self.start])
+        visited[self.start] = 1
+        order.append(self.start)
+
+        direction = 1  # 1 for left to right, -1 for right to left.
+        level = 0
+
+        while queue:
+            # Determine the level of the current to know its direction.
+            current = queue[0] if direction == 1 else queue[-1]
+            if levels[current] > level:
+                level = levels[current]
+                direction *= -1
+            current = queue.popleft() if direction == 1 else queue.pop()
+            if current == goal:
+                break
+
+            offsets = forward if direction == 1 else backward
+            for offset in offsets:
+                next_pos = current + offset
+                if not visited[next_pos] and grid[next_pos]:
+                    visited[next_pos] = 1
+                    order.append(next_pos)
+                    parent[next_pos] = current
+                    levels[next_pos] = level + 1
+                    if direction == 1:
+                        queue.append(next_pos)
+                    else:
+                        queue.appendleft(next_pos)
+
+        return self._backtrack()
+
+
+
+class FlatUCS(FlatSearch):
+    """
+    Uniform-Cost Search on flat cell indices. It pops the cells in the same
+    order as UCS, so it returns the same paths.
+    """
+
+    def _initialize(self):
+        """
+        Allocates the buffers of the search, including the cost of the path
+        to each cell.
+        """
+        super()._initialize()
+        self.cost = array('i', [-1]) * self.size
+
+
+    def solve(self) -> list|str:
+        """
+        Implements the Uniform-Cost Search algorithm.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+
+        grid, visited, parent, order = self.cells, self.visited, self.parent, self.order
+        cost, offsets, goal = self.cost, self.offsets, self.goal
+
+        queue = [(0, self.start)]
+        visited[self.start] = 1
+        order.append(self.start)
+        cost[self.start] = 0
+
+        while queue:
+            current_cost, current = heappop(queue)
+            if current == goal:
+                break
+            for offset in offsets:
+                next_pos = current + offset
+                if not visited[next_pos] and grid[next_pos]:
+                    new_cost = current_cost + grid[next_pos] - 1
+                    heappush(queue, (new_cost, next_pos))
+                    visited[next_pos] = 1
+                    order.append(next_pos)
+                    parent[next_pos] = current
+                    cost[next_pos] = new_cost
+
+        return self._backtrack()
+
+
+    @property
+    def cost_so_far(self) -> dict[tuple[int, int], int]:
+        """
+        Returns:
+            (Dict): cost of the path to each reached position.
+        """
+        return {self.grid.to_position(index): self.cost[index] for index in self.order}
+
+
+
+class FlatIDS(FlatSearch):
+    """
+    Iterative Deepening Search on flat cell indices. Like IDS, it uses an
+    explicit stack and a table with the lowest depth of each cell, and every
+    iteration resumes from the cells left at the previous limit, so it
+    returns the same paths as IDS.
+    """
+
+    def __init__(self, maze:Maze, step:int=1):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+            step (int): how much the depth limit grows on every iteration.
+        """
+        if step < 1:
+            raise ValueError('The depth step must be at least 1')
+
+        super().__init__(maze)
+        self.step = step
+
+
+    def _initialize(self):
+        """
+        Allocates the buffers of the search, including the lowest depth at
+        which each cell has been reached.
+        """
+        super()._initialize()
+        self.depths = array('i', [-1]) * self.size
+
+
+    def solve(self) -> list|str:
+        """
+        Implements the IDDFS algorithm.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+
+        grid, visited, parent, order = self.cells, self.visited, self.parent, self.order
+        depths, start, goal = self.depths, self.start, self.goal
+
+        # The moves are pushed in reverse so they are taken out in order.
+        offsets = self.offsets[::-1]
+
+        visited[start] = 1
+        order.append(start)
+        depths[start] = 0
+
+        # Cells left at the depth limit, with the depth they were left at.
+        boundary = [(start, 0)]
+        limit = 0
+
+        while boundary:
+            limit += self.step
+            stack = [(cell, depth) for cell, depth in reversed(boundary) if depths[cell] == depth]
+            boundary = []
+
+            while stack:
+                current, depth = stack.pop()
+
+                # Skip it if it was reached later through a shallower path.
+                if depths[current] < depth:
+                    continue
+                if depth == limit:
+                    boundary.append((current, depth))
+                    continue
+
+                depth += 1
+                for offset in offsets:
+                    next_pos = current + offset
+                    if grid[next_pos] and (not visited[next_pos] or depth < depths[next_pos]):
+                        if not visited[next_pos]:
+                            visited[next_pos] = 1
+                            order.append(next_pos)
+                        depths[next_pos] = depth
+                        parent[next_pos] = current
+                        if next_pos == goal:
+                            return self._backtrack()
+                        stack.append((next_pos, depth))
+
+        return 'No existe una solución'
+
+
+
+if __name__ == '__main__':
+
+    # Open the file with a matrix
+    maze = Maze('./data/matrix.txt')
+
+    # Find the path from the start to the goal
+    print("Solution BFS: ", FlatBFS(maze).solve())
+    print("Solution BFS intercalado: ", FlatBFS(maze).solve_zigzag())
+    print("Solution UCS: ", FlatUCS(maze).solve())
+    print("Solution IDS: ", FlatIDS(maze).solve())
@@ -0,0 +1,350 @@
+import argparse
+
+import numpy as np
+
+from constant import Constant
+from maze import Maze
+from mazeio import MazeIO
+
+
+
+# Probability of each cost among the cells that are not walls.
+COST_MIXES = {
+    'uniform': {Constant.EMPTY: 1.0},
+    'mixed': {Constant.EMPTY: 0.6, Constant.CIGAR: 0.25, Constant.FOX: 0.15},
+}
+
+
+
+class MazeGenerator(Constant):
+    """
+    Class that creates random mazes that always have a solution, without
+    a window. Every instance has its own seeded random generator, so the
+    same seed and parameters give the same maze.
+
+    The algorithms are:
+        'fill': every cell is a wall with a given probability, and a random
+                corridor from Pinocchio to Gepetto is cleared. It only uses
+                NumPy, so it is the one for very large mazes.
+        'backtracker': a perfect maze carved by an iterative depth-first
+                search, with long winding corridors.
+        'kruskal': a perfect maze made by joining the cells in a random
+                order with Kruskal's algorithm, with many short dead ends.
+
+    The perfect mazes have their cells on the even rows and columns, and
+    the walls between them can be opened at random to add loops.
+    """
+
+    ALGORITHMS = ('fill', 'backtracker', 'kruskal')
+
+    def __init__(self, seed:int|None=None, walls:float=0.25, costs:dict|None=None, loops:float=0.0):
+        """
+        Initializes the class instance.
+
+        Args:
+            seed (int): seed of the random generator, or None for a random one.
+            walls (float): probability of a cell being a wall, for 'fill'.
+            costs (dict): probability of each value among the cells that
+                          are not walls, 'mixed' of COST_MIXES by default.
+            loops (float): probability of opening each remaining wall
+                           between two cells, for the perfect mazes.
+        """
+        if not 0 <= walls < 1 or not 0 <= loops <= 1:
+            raise ValueError('The probabilities of walls and loops must be between 0 and 1')
+
+        self.rng = np.random.default_rng(seed)
+        self.walls = walls
+        self.costs = costs if costs is not None else COST_MIXES['mixed']
+        self.loops = loops
+
+
+    def generate(self, rows:int, cols:int, algorithm:str='fill') -> np.ndarray:
+        """
+        Creates a maze with one of the algorithms.
+
+        Args:
+            rows (int): number of rows of the maze.
+            cols (int): number of columns of the maze.
+            algorithm (str): name of the algorithm, one of ALGORITHMS.
+
+        Returns:
+            (ndarray): the numeric matrix of the maze.
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f'Unknown algorithm {algorithm!r}, expected one of {self.ALGORITHMS}')
+        if not self.fits(rows, cols, algorithm):
+            raise ValueError(f'The maze of {algorithm!r} needs at least two cells for Pinocchio and Gepetto')
+        return getattr(self, algorithm)(rows, cols)
+
+
+    @staticmethod
+    def fits(rows:int, cols:int, algorithm:str='fill') -> bool:
+        """
+        Checks if a maze of a size has room for Pinocchio and Gepetto. The
+        perfect mazes only put them on the cells of their lattice, on the
+        even rows and columns.
+
+        Args:
+            rows (int): number of rows of the maze.
+            cols (int): number of columns of the maze.
+            algorithm (str): name of the algorithm, one of ALGORITHMS.
+
+        Returns:
+            (bool): True if the maze can be created.
+        """
+        if rows < 1 or cols < 1:
+            return False
+        if algorithm != 'fill':
+            rows, cols = (rows + 1) // 2, (cols + 1) // 2
+        return rows * cols >= 2
+
+
+    def maze(self, rows:int, cols:int, algorithm:str='fill') -> Maze:
+        """
+        Creates a maze with one of the algorithms.
+
+        Args:
+            rows (int): number of rows of the maze.
+            cols (int): number of columns of the maze.
+            algorithm (str): name of the algorithm, one of ALGORITHMS.
+
+        Returns:
+            (Maze): the generated maze.
+        """
+        return Maze('', matrix=self.generate(rows, cols, algorithm))
+
+
+    def fill(self, rows:int, cols:int, start:tuple|None=None, goal:tuple|None=None,
+             solvable:bool=True) -> np.ndarray:
+        """
+        Fills the cells at random and clears a corridor from the start to
+        the goal: a random order of the moves towards the goal, so it is as
+        short as possible but never the same.
+
+        Args:
+            rows (int): number of rows of the maze.
+            cols (int): number of columns of the maze.
+            start (tuple): Pinocchio's position, or None for a random one.
+            goal (tuple): Gepetto's position, or None for a random one.
+            solvable (bool): False to leave the walls of the corridor.
+
+        Returns:
+            (ndarray): the numeric matrix of the maze.
+        """
+        matrix = self._values((rows, cols))
+        wall = self.rng.random((rows, cols)) < self.walls
+        if start is None or goal is None:
+            start, goal = self._positions(rows, cols)
+
+        if solvable:
+            # Shuffle the vertical and horizontal moves, and clear the walls
+            # on the way.
+            rows_moved, cols_moved = goal[0] - start[0], goal[1] - start[1]
+            moves = np.zeros(abs(rows_moved) + abs(cols_moved), dtype=bool)
+            moves[:abs(rows_moved)] = True
+            self.rng.shuffle(moves)
+            path_rows = start[0] + np.concatenate([[0], np.cumsum(moves) * np.sign(rows_moved)])
+            path_cols = start[1] + np.concatenate([[0], np.cumsum(~moves) * np.sign(cols_moved)])
+            wall[path_rows, path_cols] = False
+
+        matrix[wall] = self.WALL
+        matrix[start] = self.PINOCCHIO
+        matrix[goal] = self.GEPETTO
+        return matrix
+
+
+    def backtracker(self, rows:int, cols:int) -> np.ndarray:
+        """
+        Carves a perfect maze with a depth-first search that goes to a
+        random unvisited neighbor, and goes back when there is none.
+
+        Args:
+            rows (int): number of rows of the maze.
+            cols (int): number of columns of the maze.
+
+        Returns:
+            (ndarray): the numeric matrix of the maze.
+        """
+        height, width = (rows + 1) // 2, (cols + 1) // 2
+        cells = height * width
+        right = bytearray(cells)
+        down = bytearray(cells)
+        visited = bytearray(cells)
+
+        # One random number for every carved passage, drawn at once.
+        randoms = iter(self.rng.random(cells).tolist())
+        start = int(self.rng.integers(cells))
+        visited[start] = 1
+        stack = [start]
+
+        while stack:
+            current = stack[-1]
+            row, col = divmod(current, width)
+            neighbors = []
+            if row > 0 and not visited[current - width]:
+                neighbors.append(current - width)
+            if col < width - 1 and not visited[current + 1]:
+                neighbors.append(current + 1)
+            if row < height - 1 and not visited[current + width]:
+                neighbors.append(current + width)
+            if col > 0 and not visited[current - 1]:
+                neighbors.append(current - 1)
+
+            if not neighbors:
+                stack.pop()
+                continue
+
+            neighbor = neighbors[int(next(randoms) * len(neighbors))]
+            # The passage is kept on the cell above or on the left.
+            if neighbor == current + 1:
+                right[current] = 1
+            elif neighbor == current - 1:
+                right[neighbor] = 1
+            elif neighbor == current + width:
+                down[current] = 1
+            else:
+                down[neighbor] = 1
+            visited[neighbor] = 1
+            stack.append(neighbor)
+
+        return self._lattice(rows, cols, right, down)
+
+
+    def kruskal(self, rows:int, cols:int) -> np.ndarray:
+        """
+        Builds a perfect maze by opening the walls between the cells in a
+        random order, unless both cells are already connected.
+
+        Args:
+            rows (int): number of rows of the maze.
+            cols (int): number of columns of the maze.
+
+        Returns:
+            (ndarray): the numeric matrix of the maze.
+        """
+        height, width = (rows + 1) // 2, (cols + 1) // 2
+        cells = height * width
+        right = bytearray(cells)
+        down = bytearray(cells)
+
+        # A wall is 2 * cell for the one on its right and 2 * cell + 1 for
+        # the one below it. The ones on the border do not exist.
+        edges = np.arange(2 * cells).reshape(height, width, 2)
+        valid = np.ones(edges.shape, dtype=bool)
+        valid[:, -1, 0] = False
+        valid[-1, :, 1] = False
+        edges = self.rng.permutation(edges[valid]).tolist()
+
+        parent = list(range(cells))
+        joined = 1
+        for edge in edges:
+            cell, below = edge >> 1, edge & 1
+            other = cell + width if below else cell + 1
+
+            # Find the roots of both cells, halving their paths.
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            while parent[other] != other:
+                parent[other] = parent[parent[other]]
+                other = parent[other]
+            if cell == other:
+                continue
+
+            parent[cell] = other
+            if below:
+                down[edge >> 1] = 1
+            else:
+                right[edge >> 1] = 1
+            joined += 1
+            if joined == cells:
+                break
+
+        return self._lattice(rows, cols, right, down)
+
+
+    def _lattice(self, rows:int, cols:int, right:bytearray, down:bytearray) -> np.ndarray:
+        """
+        Builds the matrix of a perfect maze from the passages between its
+        cells, opening some other walls at random if there are loops.
+
+        Args:
+            rows (int): number of rows of the maze.
+            cols (int): number of columns of the maze.
+            right (bytearray): 1 for the cells open to the cell on their right.
+            down (bytearray): 1 for the cells open to the cell below them.
+
+        Returns:
+            (ndarray): the numeric matrix of the maze.
+        """
+        height, width = (rows + 1) // 2, (cols + 1) // 2
+        right = np.frombuffer(right, dtype=bool).reshape(height, width)[:, :-1]
+        down = np.frombuffer(down, dtype=bool).reshape(height, width)[:-1]
+        if self.loops:
+            right = right | (self.rng.random(right.shape) < self.loops)
+            down = down | (self.rng.random(down.shape) < self.loops)
+
+        open_cells = np.zeros((rows, cols), dtype=bool)
+        open_cells[::2, ::2] = True
+        open_cells[::2, 1::2][:, :width - 1] = right
+        open_cells[1::2, ::2][:height - 1] = down
+
+        matrix = self._values((rows, cols))
+        matrix[~open_cells] = self.WALL
+
+        start, goal = self._positions(height, width)
+        matrix[start[0] * 2, start[1] * 2] = self.PINOCCHIO
+        matrix[goal[0] * 2, goal[1] * 2] = self.GEPETTO
+        return matrix
+
+
+    def _values(self, shape:tuple) -> np.ndarray:
+        """
+        Draws the values of the cells that are not walls.
+
+        Args:
+            shape (tuple): rows and columns of the maze.
+
+        Returns:
+            (ndarray): the values, with the probabilities of the costs.
+        """
+        values = np.array(list(self.costs), dtype=np.int8)
+        weights = np.array(list(self.costs.values()), dtype=float)
+        return values[self.rng.choice(len(values), size=shape, p=weights / weights.sum())]
+
+
+    def _positions(self, rows:int, cols:int) -> tuple:
+        """
+        Draws two different random positions.
+
+        Args:
+            rows (int): number of rows to choose from.
+            cols (int): number of columns to choose from.
+
+        Returns:
+            (tuple): the positions of Pinocchio and Gepetto.
+        """
+        start, goal = self.rng.choice(rows * cols, size=2, replace=False).tolist()
+        return divmod(start, cols), divmod(goal, cols)
+
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Creates random mazes that have a solution.')
+    parser.add_argument('rows', type=int)
+    parser.add_argument('cols', type=int)
+    parser.add_argument('output', help='text file, or binary if it ends in .maze')
+    parser.add_argument('--algorithm', choices=MazeGenerator.ALGORITHMS, default='fill')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--walls', type=float, default=0.25)
+    parser.add_argument('--costs', choices=list(COST_MIXES), default='mixed')
+    parser.add_argument('--loops', type=float, default=0.0)
+    args = parser.parse_args()
+
+    generator = MazeGenerator(args.seed, args.walls, COST_MIXES[args.costs], args.loops)
+    matrix = generator.generate(args.rows, args.cols, args.algorithm)
+    if args.output.lower().endswith(MazeIO.BINARY):
+        MazeIO.write_binary(args.output, matrix)
+    else:
+        MazeIO.write_text(args.output, matrix)
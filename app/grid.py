@@ -0,0 +1,230 @@
+import numpy as np
+
+from constant import Constant
+
+
+
+class Grid(Constant):
+    """
+    Class that represents a maze padded with a border of walls and
+    flattened, shared by all the solvers of the maze.
+
+    A cell is an integer index of the padded grid, and its neighbors are
+    found by adding a fixed offset, so no search needs bounds checks: the
+    moves out of the maze land on the border, which is a wall. The grid
+    keeps a single byte per cell, 0 for the walls and the value plus one
+    for the others, so the passability check and the cost of a cell are a
+    single read:
+
+        cells: the bytes as a bytearray, for the searches run in Python.
+        codes: the same bytes as a NumPy array, without a copy, for the
+               searches run with NumPy.
+        adjacency: the moves out of every cell to the cells that are not
+                   walls, with their costs, in compressed sparse rows
+                   (CSR). It is built the first time it is needed.
+
+    Both the bytes and the adjacency are built a block of rows at a time,
+    so building them takes little more memory than keeping them.
+    """
+
+    # Define the possible moves: ↑, →, ↓, ←
+    MOVES = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+    # Cells converted at a time when the grid and its adjacency are built.
+    BLOCK = 2**16
+
+    def __init__(self, matrix:np.ndarray):
+        """
+        Initializes the class instance.
+
+        Args:
+            matrix (ndarray): the numeric matrix of the maze.
+        """
+        self.rows, self.cols = matrix.shape
+        self.width = self.cols + 2
+        self.size = (self.rows + 2) * self.width
+
+        # The border is left as walls, 0.
+        self.cells = bytearray(self.size)
+        self.codes = np.frombuffer(self.cells, dtype=np.uint8)
+        inner = self.codes.reshape(self.rows + 2, self.width)[1:-1, 1:-1]
+
+        step = max(1, self.BLOCK // max(1, self.cols))
+        for row in range(0, self.rows, step):
+            block = matrix[row:row + step]
+            # The values of the constants fit in a byte once shifted by one.
+            if block.size and (block.min() < self.WALL or block.max() > 254):
+                raise ValueError('The value of a cell must be between -1 and 254')
+            inner[row:row + step] = block + np.int16(1)
+
+        self.offsets = tuple(row * self.width + col for row, col in self.MOVES)
+        self._offsets = np.array(self.offsets)
+        self._adjacency = None
+
+
+    def update(self, position:tuple[int, int], value:int):
+        """
+        Changes the value of a cell in place, so the solvers that share the
+        grid see it, and discards the adjacency.
+
+        Args:
+            position (tuple): a specific position within the maze.
+            value (int): the new value of the cell.
+        """
+        self.cells[self.to_index(position)] = value + 1
+        self._adjacency = None
+
+
+    def to_index(self, position:tuple[int, int]) -> int:
+        """
+        Converts a position of the maze into a flat index of the padded grid.
+
+        Args:
+            position (tuple): a specific position within the maze.
+
+        Returns:
+            (int): the flat index of the position.
+        """
+        return (int(position[0]) + 1) * self.width + int(position[1]) + 1
+
+
+    def to_position(self, index:int) -> tuple[int, int]:
+        """
+        Converts a flat index of the padded grid into a position of the maze.
+
+        Args:
+            index (int): a flat index of the padded grid.
+
+        Returns:
+            (tuple): the position within the maze.
+        """
+        row, col = divmod(index, self.width)
+        return (row - 1, col - 1)
+
+
+    def to_positions(self, indices:np.ndarray) -> list[tuple[int, int]]:
+        """
+        Converts many flat indices of the padded grid into positions of the
+        maze at once.
+
+        Args:
+            indices (ndarray): flat indices of the padded grid.
+
+        Returns:
+            (List): the positions within the maze.
+        """
+        rows, cols = np.divmod(indices, self.width)
+        return list(zip((rows - 1).tolist(), (cols - 1).tolist()))
+
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            (int): the bytes taken by the cells, and by the adjacency if it
+                   has been built.
+        """
+        size = len(self.cells)
+        if self._adjacency is not None:
+            size += sum(array.nbytes for array in self._adjacency)
+        return size
+
+
+    def min_cost(self) -> int:
+        """
+        Finds the cheapest cost of entering a cell of the maze, which scales
+        the heuristics of the informed searches. Pinocchio's cell costs
+        nothing but it is never entered again, so it is ignored unless there
+        are several of them.
+
+        Returns:
+            (int): the minimum cost of a move.
+        """
+        pinocchio = self.PINOCCHIO + 1
+        if np.count_nonzero(self.codes == pinocchio) > 1:
+            return 0
+        # The walls and Pinocchio are left out as the highest byte.
+        cheapest = int(np.where(self.codes > pinocchio, self.codes, 255).min())
+        if cheapest == 255 and not np.any(self.codes == 255):
+            return 0
+        return cheapest - 1
+
+
+    @property
+    def adjacency(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns:
+            (tuple): the moves out of every cell in compressed sparse rows:
+                     the moves of the cell i are the entries from indptr[i]
+                     to indptr[i + 1] of the arrays of moves, the index of
+                     each one in MOVES and offsets, and of costs, the cost
+                     of entering the cell it leads to. The walls have none.
+        """
+        if self._adjacency is None:
+            # There are at most four moves per cell, so the positions of the
+            # moves only need 64 bits on grids of hundreds of millions of cells.
+            index_type = np.int32 if 4 * self.size < 2**31 else np.int64
+            indptr = np.zeros(self.size + 1, dtype=index_type)
+
+            # The moves of every cell are counted first, so the arrays of
+            # the moves are filled in place.
+            for cells, valid in self._blocks():
+                indptr[cells + 1] = valid.sum(axis=1)
+            np.cumsum(indptr, out=indptr)
+
+            moves = np.empty(int(indptr[-1]), dtype=np.int8)
+            costs = np.empty(int(indptr[-1]), dtype=np.uint8)
+            for cells, valid in self._blocks():
+                first, last = indptr[cells[0]], indptr[cells[-1] + 1]
+                moves[first:last] = np.broadcast_to(
+                    np.arange(len(self.offsets), dtype=np.int8), valid.shape)[valid]
+                costs[first:last] = self.codes[(cells[:, None] + self._offsets)[valid]] - np.uint8(1)
+
+            self._adjacency = (indptr, moves, costs)
+        return self._adjacency
+
+
+    def _blocks(self):
+        """
+        Finds the moves out of the cells that are not walls, a block of rows
+        at a time.
+
+        Yields:
+            (tuple): the cells of a block that are not walls, in order, and
+                     for each one which of its moves lead to another one.
+                     Row i holds the moves of the i-th cell, so the
+                     flattened order keeps the moves of every cell together
+                     and in order.
+        """
+        # The border is only walls, so the blocks start on the second row
+        # and end on the second to last one.
+        step = max(1, self.BLOCK // self.width) * self.width
+        end = self.size - self.width
+        for first in range(self.width, end, step):
+            cells = first + np.flatnonzero(self.codes[first:min(first + step, end)])
+            if len(cells):
+                yield cells, self.codes[cells[:, None] + self._offsets] != 0
+
+
+    def neighbors(self, cells:np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the moves out of many cells at once with the adjacency.
+
+        Args:
+            cells (ndarray): flat indices of the cells.
+
+        Returns:
+            (tuple): for every move, in the order of the cells and then of
+                     the moves, the position in cells of the cell it leaves,
+                     the index of the move and the cell it leads to.
+        """
+        indptr, moves, _ = self.adjacency
+        starts = indptr[cells]
+        counts = indptr[cells + 1] - starts
+        sources = np.repeat(np.arange(len(cells)), counts)
+
+        # The entry of every move is the first one of its cell plus its
+        # rank among the moves of the cell.
+        shift = starts - (np.cumsum(counts) - counts)
+        edges = moves[np.arange(len(sources)) + shift[sources]]
+        return sources, edges, cells[sources] + self._offsets[edges]
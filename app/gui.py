@@ -1,7 +1,5 @@
-import time
 import numpy as np
 
-from PIL import Image, ImageTk as I
 import tkinter as tk
 import tkinter.ttk as ttk
 from tkinter import filedialog
@@ -11,9 +9,10 @@ from constant import Constant
 from createRandom import Random
 
 from maze import Maze
-from bfs import BFS
-from ucs import UCS
-from ids import IDS
+from animator import Animator
+from cache import ResultCache
+from renderer import BitmapRenderer, CanvasRenderer
+from worker import SearchWorker
 
 
 
@@ -26,6 +25,8 @@ class Board(Constant):
     TITLE = 'Métodos de búsqueda no informados'
 
     SQUARE_SIZE = 60
+    # Boards with more cells are drawn as an image that can be zoomed.
+    BITMAP_CELLS = 2500
 
     COLORS = {
         'border': '#243B5D',
@@ -35,6 +36,26 @@ class Board(Constant):
         'path': '#FFC500',
     }
 
+    # Cells drawn per second at the start, and the range of the control,
+    # which goes by powers of ten.
+    SPEED = 10
+    SPEED_RANGE = (0, 4)
+
+    # Milliseconds between two reads of the messages of a running search.
+    POLL = 50
+
+    # Search algorithm of each option.
+    ALGORITHMS = {
+        1: 'bfs',
+        2: 'bfs_zigzag',
+        3: 'ucs',
+        4: 'ids',
+        5: 'astar',
+        6: 'bfs_bidirectional',
+        7: 'ucs_bidirectional',
+        8: 'jps',
+    }
+
 
     def __init__(self, filename:str):
         """
@@ -44,6 +65,8 @@ class Board(Constant):
             filename (str): path of the file with the numeric matrix
                             that represents the maze.
         """
+        self.cache = ResultCache()
+        self.worker = None
         self._charge_file(filename)
         self._initialize()
         self._display_board()
@@ -82,6 +105,10 @@ class Board(Constant):
         # Create the canvas that represents the board.
         self.canvas = tk.Canvas(self.window)
         self.canvas.pack(padx=5, pady=5)
+        self.canvas_renderer = CanvasRenderer(self.canvas, self.COLORS, self.SQUARE_SIZE)
+        self.bitmap_renderer = BitmapRenderer(
+            self.canvas, self.COLORS, self.SQUARE_SIZE, self.canvas_renderer.sprites)
+        self.renderer = self.canvas_renderer
 
         # Create the frame that contains the radio buttons with the options.
         self.options = tk.Frame(self.window,bg='#FEDBB3', border='10')
@@ -97,6 +124,14 @@ class Board(Constant):
             variable=self.option, value=3, font=('Arial', 12), bg='#FEDBB3' ,cursor='hand2').pack(anchor='w')
         tk.Radiobutton(self.options,text="Búsqueda por profundidad iterativa.",
             variable=self.option, value=4, font=('Arial', 12), bg='#FEDBB3' ,cursor='hand2').pack(anchor='w')
+        tk.Radiobutton(self.options,text="Búsqueda A*.",
+            variable=self.option, value=5, font=('Arial', 12), bg='#FEDBB3' ,cursor='hand2').pack(anchor='w')
+        tk.Radiobutton(self.options,text="Búsqueda por amplitud bidireccional.",
+            variable=self.option, value=6, font=('Arial', 12), bg='#FEDBB3' ,cursor='hand2').pack(anchor='w')
+        tk.Radiobutton(self.options,text="Búsqueda por costo uniforme bidireccional.",
+            variable=self.option, value=7, font=('Arial', 12), bg='#FEDBB3' ,cursor='hand2').pack(anchor='w')
+        tk.Radiobutton(self.options,text="Búsqueda por puntos de salto (JPS).",
+            variable=self.option, value=8, font=('Arial', 12), bg='#FEDBB3' ,cursor='hand2').pack(anchor='w')
 
         # Create the frame that contains the buttons.
         self.buttons = tk.Frame(self.window,bg='#FEDBB3',borderwidth=5)
@@ -114,6 +149,34 @@ class Board(Constant):
             command=self._display_board)
         self.clear_btn.pack(side=tk.RIGHT, anchor='e', padx=5, pady=5)
 
+        # Create button to show the result without waiting for the animation.
+        self.skip_btn = tk.Button(self.buttons, text='Saltar al resultado',
+            font=('Impact', 11), relief='flat',cursor='hand2', padx=15, bg='#5F3119',fg='#FFE4D5',
+            state=tk.DISABLED, command=self._skip_animation)
+        self.skip_btn.pack(side=tk.RIGHT, anchor='e', padx=5, pady=5)
+
+        # Create button to stop a running search.
+        self.cancel_btn = tk.Button(self.buttons, text='Cancelar búsqueda',
+            font=('Impact', 11), relief='flat',cursor='hand2', padx=15, bg='#5F3119',fg='#FFE4D5',
+            state=tk.DISABLED, command=self._cancel_search)
+        self.cancel_btn.pack(side=tk.RIGHT, anchor='e', padx=5, pady=5)
+
+        # Create the control of the speed of the animation.
+        self.speed = tk.DoubleVar(value=np.log10(self.SPEED))
+        self.speed_label = tk.Label(self.buttons, bg='#FEDBB3', font=('Arial', 10), width=16)
+        tk.Scale(self.buttons, variable=self.speed, from_=self.SPEED_RANGE[0], to=self.SPEED_RANGE[1],
+            resolution=0.1, orient=tk.HORIZONTAL, showvalue=False, bg='#FEDBB3', highlightthickness=0,
+            command=self._change_speed).pack(side=tk.LEFT, padx=5)
+        self.speed_label.pack(side=tk.LEFT)
+
+        # Create the label with the progress of a running search.
+        self.status_label = tk.Label(self.buttons, bg='#FEDBB3', font=('Arial', 10), width=30)
+        self.status_label.pack(side=tk.LEFT)
+
+        # Create the animation of the searches.
+        self.animator = Animator(self.window, self._draw_step)
+        self._change_speed()
+
         # Create the menu.
         self.menubar = tk.Menu(self.window, border=1)
         self.window.config(menu=self.menubar)
@@ -191,33 +254,81 @@ class Board(Constant):
                 title="¡Cuidado!")
             return
 
-        # Breadth First Search.
-        if option == 1:
-            bfs = BFS(self.maze)
-            path = bfs.solve()
-            visited = bfs.visited_list
-
-        # Breadth First Search with zig-zag behavior.
-        elif option == 2:
-            bfs = BFS(self.maze)
-            path = bfs.solve_zigzag()
-            visited = bfs.visited_list
-
-        # Uniform Cost Search.
-        elif option == 3:
-            ucs = UCS(self.maze)
-            path = ucs.solve()
-            visited = ucs.visited_list
-            self.costs = ucs.cost_so_far
-
-        # Iterative Deepening Search.
-        elif option == 4:
-            ids = IDS(self.maze)
-            path = ids.solve()
-            visited = ids.visited_list
+        # Show the result from the cache, or search in the background if it
+        # is not there.
+        algorithm = self.ALGORITHMS[option]
+        key = self.cache.key(self.maze, algorithm)
+        result = self.cache.get(key)
+        if result is not None:
+            self._show_result(result, option)
+            return
+
+        self.worker = SearchWorker(self.maze, algorithm)
+        self.worker.start()
+
+        self.find_path_btn.config(state=tk.DISABLED)
+        self.clear_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.status_label.config(text='Buscando...')
+        self.window.after(self.POLL, self._poll_search, self.worker, key, option)
+
+
+    def _poll_search(self, worker:SearchWorker, key:str, option:int):
+        """
+        Reads the messages of a search running in the background: shows its
+        progress while it runs, and its result when it ends.
+
+        Args:
+            worker (SearchWorker): the running search.
+            key (str): the key of its result in the cache.
+            option (int): the option selected when the search started.
+        """
+        # The search was left behind by a new board.
+        if worker is not self.worker:
+            return
+
+        for message in worker.poll():
+            kind = message[0]
+            if kind == SearchWorker.PROGRESS:
+                self.status_label.config(text=f'Expandidas: {message[1]}  Frontera: {message[2]}')
+                continue
+
+            self.worker = None
+            self.status_label.config(text='')
+            if kind == SearchWorker.DONE:
+                self.cache.put(key, message[1])
+                self._show_result(message[1], option)
+            elif kind == SearchWorker.CANCELLED:
+                self.status_label.config(text='Búsqueda cancelada')
+                self._enable_buttons()
+            else:
+                self._enable_buttons()
+                messagebox.showerror(title='Error', message=f'La búsqueda falló: {message[1]}')
+            return
+
+        self.window.after(self.POLL, self._poll_search, worker, key, option)
+
+
+    def _cancel_search(self):
+        """
+        Stops the search running in the background.
+        """
+        if self.worker is not None:
+            self.worker.cancel()
+        self.cancel_btn.config(state=tk.DISABLED)
+
 
+    def _show_result(self, result, option:int):
+        """
+        Shows a result on a clean board.
+
+        Args:
+            result (Result): the path, the visited positions and the costs.
+            option (int): the option of the algorithm that found it.
+        """
+        self.costs = result.costs
         self._display_board()
-        self._display_path(path, visited)
+        self._display_path(result.path, result.visited, option)
 
 
     def _config_canvas(self):
@@ -234,125 +345,97 @@ class Board(Constant):
         Paint the board depending on the size of the cells and the
         defined colors.
         """
-        # Resize the canvas.
-        self._config_canvas()
+        # Stop the previous search and its animation, if they are running.
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+            self.status_label.config(text='')
+        self.animator.stop()
+        self._enable_buttons()
+
+        # Large boards are drawn as an image, and the small ones with an
+        # item per cell on a canvas resized to show the full board.
+        rows, cols = self.maze.maze.shape
+        renderer = self.bitmap_renderer if rows * cols > self.BITMAP_CELLS else self.canvas_renderer
+        if renderer is not self.renderer:
+            self.renderer.detach()
+            self.renderer = renderer
+        if renderer is self.canvas_renderer:
+            self._config_canvas()
+
+        self.renderer.draw(self.maze)
+
+
+    def _display_path(self, pathway:list|str, extends:list, option:int):
+        """
+        Starts the animation of a search: first the visited cells and then
+        the path. The window keeps working while it runs.
 
-        # Shortcuts for the colors and the size.
-        empty = self.COLORS['empty']
-        wall = self.COLORS['wall']
-        border = self.COLORS['border']
-
-        size = self.SQUARE_SIZE
-
-        for i, row in enumerate(self.matrix):
-            for j, value in enumerate(row):
-                x1, y1 = (j * size), (i * size)
-                x2, y2 = (x1 + size), (y1 + size)
-                if value == self.WALL:
-                    self.canvas.create_rectangle(
-                        x1, y1, x2, y2, fill=wall, outline=border)
-                else:
-                    self.canvas.create_rectangle(
-                        x1, y1, x2, y2, fill=empty, outline=border)
-                self.canvas.create_rectangle(
-                    3, 3, self.width, self.height, fill='', outline=border,
-                    width=2)
-
-        self._set_images()
-
-
-    def _set_images(self):
-        """
-        Places the images on the canvas according to the numerical value of
-        each cell of the matrix.
-        """
-        size = self.SQUARE_SIZE
-        sizes = (size, size)
-
-        self.images = {
-            self.PINOCCHIO: I.PhotoImage(
-                Image.open("./images/pinocho.png").resize(sizes)),
-            self.CIGAR: I.PhotoImage(
-                Image.open("./images/cigarro.png").resize(sizes)),
-            self.FOX: I.PhotoImage(
-                Image.open("./images/zorro.png").resize(sizes)),
-            self.GEPETTO: I.PhotoImage(
-                Image.open("./images/gepeto.png").resize(sizes)),
-            self.WALL: I.PhotoImage(
-                Image.open("./images/fondo.png").resize(sizes)
-            ),
-            self.EMPTY: I.PhotoImage(
-                Image.open("./images/suelo.png").resize(sizes)
-            )
-            
-        }
+        Args:
+            pathway (list|str): set of coordinates that form a path, or a
+                                message if there is none.
+            extends (list): set of coordinates that has been visited for
+                            Pinocchio.
+            option (int): the option of the algorithm that found the path.
+                          The radio buttons can change during the search,
+                          so it is not read from them.
+        """
+        # Disable the buttons while drawing the path, except the skip one.
+        self.find_path_btn.config(state=tk.DISABLED)
+        self.clear_btn.config(state=tk.DISABLED)
+        self.skip_btn.config(state=tk.NORMAL)
+
+        # If the method is Uniform Cost Search, A* or JPS, displays the costs
+        # of the visited cells, and only for the first two on the path.
+        show_visited = option in (3, 5, 8)
+        show_path = option in (3, 5)
+        found = not isinstance(pathway, str)
+
+        steps = [('visited', cell, show_visited) for cell in extends]
+        if found:
+            steps += [('path', cell, show_path) for cell in pathway]
+
+        def done():
+            self._enable_buttons()
+            if not found:
+                messagebox.showinfo(title='Resultado', message=pathway)
 
-        for i, row in enumerate(self.matrix):
-            for j, value in enumerate(row):
-                self.canvas.create_image(j*size, i*size,
-                                        image=self.images[value],
-                                            anchor="nw")
+        self.animator.play(steps, done)
 
 
-    def _display_path(self, pathway:list=None, extends:list=None):
+    def _draw_step(self, step:tuple):
         """
-        Display a given path.
+        Paints one cell of the animation.
 
         Args:
-            path (list): set of coordinates that form a path.
-            visited (list): set of coordinates that has been visited for
-                            Pinocchio.
+            step (tuple): the color of the cell, its position and whether
+                          its cost is shown.
         """
-        # Disable all buttons while drawing the path.
-        self.find_path_btn.config(state=tk.DISABLED)
-        self.clear_btn.config(state=tk.DISABLED)
+        color, cell, show_cost = step
+        self.renderer.paint(cell, color, self.costs[cell] if show_cost else None)
+
+
+    def _skip_animation(self):
+        """
+        Draws the rest of the animation at once.
+        """
+        self.animator.skip()
 
-        # Shortcuts for used colors
-        visited = self.COLORS['visited']
-        path = self.COLORS['path']
-        border = self.COLORS['border']
-
-        # Shortcut for the square size of the board
-        size = self.SQUARE_SIZE
-
-        # Draw the visited cells on the canvas.
-        for _, cell in enumerate(extends):
-            x, y = cell
-            x1, y1 = (y * size), (x * size)
-            x2, y2 = (x1 + size), (y1 + size)
-            self.canvas.create_rectangle(x1, y1, x2, y2, width=1,
-                fill=visited, outline=border)
-            self.canvas.create_rectangle(3, 3, self.width, self.height,
-                fill='', outline=border, width=2)
-
-            # If the method is Uniform Cost Search, displays the costs.
-            if self.option.get() == 3:
-                self.canvas.create_text(x1+size/2, y1+size/2,
-                    text=self.costs[cell], font=('Arial', 11))
-
-            self._set_images()
-            self.canvas.update()
-            time.sleep(0.1)
-
-        # Draw the path on the canvas.
-        for _, cell in enumerate(pathway):
-            x, y = cell
-            x1, y1 = (y * size), (x * size)
-            x2, y2 = (x1 + size), (y1 + size)
-            self.canvas.create_rectangle(x1, y1, x2, y2, width=1,
-                fill=path, outline=border)
-            self.canvas.create_rectangle(3, 3, self.width, self.height,
-                fill='', outline=border, width=2)
-
-            # If the method is Uniform Cost Search, displays the costs.
-            if self.option.get() == 3:
-                self.canvas.create_text(x1+size/2, y1+size/2,
-                    text=self.costs[cell], font=('Arial', 11))
-
-            self._set_images()
-            self.canvas.update()
-            time.sleep(0.1)
-
-        # Enable all buttons.
+
+    def _change_speed(self, *args):
+        """
+        Applies the speed selected in the control to the animation.
+        """
+        speed = 10 ** self.speed.get()
+        self.animator.set_speed(speed)
+        self.speed_label.config(text=f'{speed:.0f} celdas/s')
+
+
+    def _enable_buttons(self):
+        """
+        Enables the buttons after a search and its animation.
+        """
         self.find_path_btn.config(state=tk.NORMAL)
         self.clear_btn.config(state=tk.NORMAL)
+        self.skip_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.DISABLED)
@@ -1,97 +1,175 @@
-from collections import deque
+from math import inf
+
 from constant import Constant
 from maze import Maze
+from stream import run, stream
+from tracer import Tracer
 
 
 
 class IDS(Constant):
     """
-    Class that implements the Breadth-Preferring Search (BFS) algorithm.
-    This algorithm is complete because it always finds an answer (if it
-    exists), but it does not guarantee that the result is optimal.
+    Class that implements the Iterative Deepening Search (IDS) algorithm.
+    It runs a depth-limited Depth-First Search (DFS) increasing the limit
+    on every iteration until the goal is found.
+
+    The DFS uses an explicit stack, so it is not bounded by the recursion
+    limit, and a table with the lowest depth at which each cell has been
+    reached, so a cell is only explored again through a shallower path.
+    Every iteration resumes from the cells left at the limit of the previous
+    one instead of starting again from Pinocchio. With a step of 1 the
+    path found has the fewest moves.
     """
 
-    def __init__(self, maze:Maze):
+    # Define the possible moves in reverse, so they are taken out of the
+    # stack as: ↑, →, ↓, ←
+    MOVES_REVERSED = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+    def __init__(self, maze:Maze, step:int=1, tracer:Tracer|None=None):
         """
         Initializes the class instance.
 
         Args:
             maze (Maze): Maze instance that represents the board.
+            step (int): how much the depth limit grows on every iteration.
+            tracer (Tracer): observer of the search, or None.
         """
+        if step < 1:
+            raise ValueError('The depth step must be at least 1')
+
         self.maze = maze.maze
         self.start = maze.start
         self.goal = maze.goal
+        self.cells, self.width = maze.grid.cells, maze.grid.width
+        self.step = step
+        self.tracer = tracer
 
 
-    def solve(self) -> list[tuple[int, int]]:
+    def solve(self) -> list|str:
         """
         Implements the IDDFS algorithm.
 
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        return run(self._search())
+
+
+    def iterate(self):
+        """
+        Runs the IDDFS algorithm step by step.
+
+        Yields:
+            (tuple): the events of the search, see stream.stream.
+        """
+        return stream(self, self._search())
+
+
+    def _search(self):
+        """
+        Deepens the search until the goal is found, yielding every expanded
+        position.
+
         Returns:
             (List): path from the start position to the end position.
         """
         self._initialize()
-        depth = 0
-        while True:
-            self.visited = set()
-            self.queue = [self.start]
-            if self._dfs(self.start, depth):
+
+        # Cells left at the depth limit, with the depth they were left at.
+        boundary = [(self.start, 0)]
+        limit = 0
+
+        while boundary:
+            limit += self.step
+            if self.tracer is not None:
+                self.tracer.on_iteration(limit)
+            if (yield from self._dfs(boundary, limit)):
                 return self._backtrack()
-            depth += 1
+            boundary = self.boundary
+
+        return 'No existe una solución'
 
-    def _dfs(self, current:tuple[int,int], depth:int) -> bool:
+
+    def _dfs(self, roots:list[tuple[tuple[int, int], int]], limit:int):
         """
-        Implements the Depth-First Search (DFS) algorithm.
+        Implements a depth-limited Depth-First Search (DFS) from the cells
+        left at the limit of the previous iteration, yielding every
+        expanded position.
 
         Args:
-            position (Tuple): a specific position within the maze.
-            depth (int): the maximum depth to explore.
+            roots (list): positions to resume from, with their depth.
+            limit (int): the maximum depth to explore.
 
         Returns:
             bool: True if the goal is found.
         """
-        if depth == 0:
-            return False
+        self.boundary = []
+
+        # The roots are pushed in reverse so they are explored in order.
+        stack = [
+            (position, depth) for position, depth in reversed(roots)
+            if self.depths[position] == depth
+        ]
 
-        if self._is_goal(current):
-            return True
+        tracer = self.tracer
 
-        self._mark_visited(self.start)
+        while stack:
+            current, depth = stack.pop()
 
-        
+            # Skip it if it was reached later through a shallower path.
+            if self.depths[current] < depth:
+                continue
 
-        return self._explore_neighbors(current, depth)
+            if depth == limit:
+                self.boundary.append((current, depth))
+                continue
 
-    def _explore_neighbors(self, current:tuple[int, int], depth:int) -> bool:
+            if tracer is not None:
+                tracer.on_expand(current, depth)
+
+            if self._explore_neighbors(current, depth, stack):
+                return True
+            yield current
+
+        return False
+
+
+    def _explore_neighbors(self, current:tuple[int, int], depth:int, stack:list) -> bool:
         """
         Evaluates neighboring cells from a given position based on
         possible moves.
 
         Args:
             current (tuple): a specific position within the maze.
-        """
-        # Define the possible moves: ↑, →, ↓, ←
-        moves = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+            depth (int): the depth of the current position.
+            stack (list): the stack of the DFS.
 
-        for move in moves:
+        Returns:
+            bool: True if the goal is one of the neighbors.
+        """
+        for move in self.MOVES_REVERSED:
             next_pos = (current[0] + move[0], current[1] + move[1])
-            if self._is_valid_position(next_pos):
-                self._add_to_queue(next_pos)
-                self._mark_visited(next_pos)
+            if self._is_valid_position(next_pos, depth + 1):
+                self._mark_visited(next_pos, depth + 1)
                 self._set_parent(next_pos, current)
-                if self._dfs(next_pos, depth - 1):
+                if self._is_goal(next_pos):
+                    if self.tracer is not None:
+                        self.tracer.on_goal(next_pos)
                     return True
-                self.queue.pop()
+                stack.append((next_pos, depth + 1))
+                if self.tracer is not None:
+                    self.tracer.on_push(next_pos, len(stack))
+
         return False
 
+
     def _initialize(self):
         """
-        Initializes the queue, the visited set and the parent dictionary
-        to keep track of the path.
+        Initializes the depth table, the visited list and the parent
+        dictionary to keep track of the path.
         """
-        self.queue = deque()
-        self.visited = set()    # disordered, unique
-        self.visited_list = []  # ordered
+        self.depths = {self.start: 0}   # lowest depth of each cell
+        self.visited_list = [self.start]  # ordered
         self.parent = {self.start: None}
 
 
@@ -108,49 +186,36 @@ class IDS(Constant):
         return position == self.goal
 
 
-    def _is_valid_position(self, position:tuple[int, int]) -> bool:
+    def _is_valid_position(self, position:tuple[int, int], depth:int) -> bool:
         """
-        Evaluates if the new position is within the bounds of the matrix
-        and if the new position hasn't been visited and isn't a wall.
+        Evaluates if the new position is within the bounds of the matrix,
+        isn't a wall and hasn't been reached at the same or a lower depth.
 
         Args:
             position (tuple): a specific position within the maze.
+            depth (int): the depth at which the position is reached.
 
         Returns:
             bool: True if the position is valid, that is, it's inside the
-                  matrix, it hasn't been visited and it's not a wall.
+                  matrix, it's not a wall and this is its shallowest path.
         """
         return (
-            (0 <= position[0] < self.maze.shape[0])
-            and (0 <= position[1] < self.maze.shape[1])
-            and position not in self.visited
-            and self.maze[position] != self.WALL
+            depth < self.depths.get(position, inf)
+            and self.cells[(position[0] + 1) * self.width + position[1] + 1]
         )
 
 
-    def _mark_visited(self, position:tuple[int, int]):
-        """
-        Evaluates if a given position has been visited.
-
-        Args:
-            position (tuple): a specific position within the maze.
-
-        Returns:
-            bool: True if the position has been visited.
-        """
-        self.visited.add(position)
-        self.visited_list.append(position)
-
-
-    def _add_to_queue(self, position:tuple[int, int]):
+    def _mark_visited(self, position:tuple[int, int], depth:int):
         """
-        Adds a position to the queue.
+        Records the depth at which a position has been reached.
 
         Args:
             position (tuple): a specific position within the maze.
+            depth (int): the depth at which the position is reached.
         """
-        self.queue.append(position)
-       
+        if position not in self.depths:
+            self.visited_list.append(position)
+        self.depths[position] = depth
 
 
     def _set_parent(self, child:tuple[int, int], parent:tuple[int, int]):
@@ -195,4 +260,4 @@ if __name__ == '__main__':
     # Find the path from the start to the goal
     ids = IDS(maze)
     path = ids.solve()
-    print(path)
\ No newline at end of file
+    print(path)
@@ -0,0 +1,286 @@
+from heapq import heappush, heappop
+
+from astar import AStar
+from maze import Maze
+from tracer import Tracer
+
+
+
+class JPS(AStar):
+    """
+    Class that implements Jump Point Search (JPS) on a 4-connected grid.
+
+    In an area of empty cells there are many paths with the same cost that
+    only differ in the order of their moves. JPS only follows the canonical
+    one, which moves vertically as soon as it can: after a horizontal move
+    it only turns when it has to (a forced neighbor). Instead of adding every
+    cell to the queue, it jumps in a straight line until it finds a cell
+    where the path may turn, called jump point.
+
+    Cells with a different cost (cigar, fox, Pinocchio and Gepetto) break
+    the symmetry, so the jumps stop on them and they are expanded in every
+    direction, like in A*. The path found is optimal.
+    """
+
+    UP, RIGHT, DOWN, LEFT = (-1, 0), (0, 1), (1, 0), (0, -1)
+
+    def __init__(self, maze:Maze, tracer:Tracer|None=None):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+            tracer (Tracer): observer of the search, or None.
+        """
+        super().__init__(maze, tracer=tracer)
+
+        # Byte of the empty cells in the padded grid of the maze.
+        self.empty = self.EMPTY + 1
+
+
+    def _search(self):
+        """
+        Implements the Jump Point Search algorithm with A* over the jump
+        points. Every expanded jump point is yielded.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+        self.jumps = {}
+
+        # A node is a position with the direction it was reached from.
+        start = (self.start, None)
+        self.node_cost = {start: 0}
+        self.node_parent = {start: None}
+        queue = [(self._heuristic(self.start), 0, 0, start)]
+        closed = set()
+        count = 0
+        tracer = self.tracer
+
+        while queue:
+            _, current_cost, _, node = heappop(queue)
+            current_cost = -current_cost
+            if node in closed:
+                continue
+            closed.add(node)
+
+            position, direction = node
+            if position not in self.visited:
+                self._mark_visited(position)
+            if tracer is not None:
+                tracer.on_expand(position, current_cost)
+            if self._is_goal(position):
+                if tracer is not None:
+                    tracer.on_goal(position)
+                return self._backtrack(node)
+
+            for next_dir in self._directions(position, direction):
+                jump = self._jump(position, next_dir)
+                if jump is None:
+                    continue
+                next_pos, jump_cost = jump
+                next_node = (next_pos, next_dir)
+                new_cost = current_cost + jump_cost
+                if next_node not in self.node_cost or new_cost < self.node_cost[next_node]:
+                    self.node_cost[next_node] = new_cost
+                    self.node_parent[next_node] = node
+                    if new_cost < self.cost_so_far.get(next_pos, new_cost + 1):
+                        self.cost_so_far[next_pos] = new_cost
+                    count += 1
+                    heappush(queue, (new_cost + self._heuristic(next_pos), -new_cost, count, next_node))
+                    if tracer is not None:
+                        tracer.on_push(next_pos, len(queue))
+            yield position
+
+        return 'No existe una solución'
+
+
+    def _directions(self, position:tuple[int, int], direction:tuple[int, int]|None) -> list:
+        """
+        Returns the directions to follow from a jump point. Only the natural
+        and forced neighbors are followed when the cell is empty.
+
+        Args:
+            position (tuple): a specific position within the maze.
+            direction (tuple): the direction it was reached from, or None.
+
+        Returns:
+            (List): the directions to jump to.
+        """
+        moves = [self.UP, self.RIGHT, self.DOWN, self.LEFT]
+        if direction is None or not self._is_empty(position):
+            back = None if direction is None else (-direction[0], -direction[1])
+            return [move for move in moves if move != back]
+
+        # After a vertical move, the path can go on or turn to both sides.
+        if direction[1] == 0:
+            return [direction, self.RIGHT, self.LEFT]
+
+        # After a horizontal move, it only turns to the forced neighbors.
+        return [direction] + [
+            move for move in (self.UP, self.DOWN) if self._is_forced(position, direction, move)
+        ]
+
+
+    def _is_forced(self, position:tuple[int, int], direction:tuple[int, int], turn:tuple[int, int]) -> bool:
+        """
+        Evaluates if a vertical move after a horizontal one is forced, that
+        is, if moving vertically first is not possible at the same cost.
+
+        Args:
+            position (tuple): the cell reached by the horizontal move.
+            direction (tuple): the horizontal direction.
+            turn (tuple): the vertical direction.
+
+        Returns:
+            bool: True if the neighbor in the vertical direction is forced.
+        """
+        side = (position[0] + turn[0], position[1] + turn[1])
+        behind = (side[0], side[1] - direction[1])
+        return self._is_passable(side) and not self._is_empty(behind)
+
+
+    def _jump(self, position:tuple[int, int], direction:tuple[int, int]) -> tuple|None:
+        """
+        Moves in a straight line from a position until it finds a jump point.
+
+        Args:
+            position (tuple): a specific position within the maze.
+            direction (tuple): the direction of the jump.
+
+        Returns:
+            (tuple): the jump point and the cost of the jump, or None if
+                     the jump reaches a wall or the border of the maze.
+        """
+        if direction[0] == 0:
+            return self._jump_horizontal(position, direction)
+
+        cost = 0
+        current = position
+
+        while True:
+            current = (current[0] + direction[0], current[1])
+            if not self._is_passable(current):
+                return None
+
+            value = self.cells[(current[0] + 1) * self.width + current[1] + 1] - 1
+            cost += value
+            if value != self.EMPTY or self._is_goal(current):
+                return current, cost
+
+            # A vertical jump stops where a horizontal one finds something.
+            if self._jump_horizontal(current, self.RIGHT) or self._jump_horizontal(current, self.LEFT):
+                return current, cost
+
+
+    def _jump_horizontal(self, position:tuple[int, int], direction:tuple[int, int]) -> tuple|None:
+        """
+        Moves horizontally from a position until it finds a jump point. The
+        vertical jumps scan the same rows many times, so the result is saved
+        for every cell crossed: from any of them the jump ends at the same
+        point, with the cost of the empty cells left behind subtracted.
+
+        Args:
+            position (tuple): a specific position within the maze.
+            direction (tuple): the horizontal direction of the jump.
+
+        Returns:
+            (tuple): the jump point and the cost of the jump, or None if
+                     the jump reaches a wall or the border of the maze.
+        """
+        key = (position, direction[1])
+        if key in self.jumps:
+            return self.jumps[key]
+
+        row, col = position
+        step = direction[1]
+        cells, width, empty = self.cells, self.width, self.empty
+        index = (row + 1) * width + col + 1
+        goal = (int(self.goal[0]), int(self.goal[1]))
+
+        crossed = [position]
+        result = None
+
+        while True:
+            col += step
+            index += step
+            byte = cells[index]
+            if not byte:
+                break
+
+            # The cell is a jump point if it is not empty, it is the goal or
+            # it has a forced neighbor above or below.
+            if (
+                byte != empty or (row, col) == goal
+                or (cells[index - width] and cells[index - width - step] != empty)
+                or (cells[index + width] and cells[index + width - step] != empty)
+            ):
+                result = ((row, col), len(crossed) + byte - 2)
+                break
+            crossed.append((row, col))
+
+        for i, cell in enumerate(crossed):
+            self.jumps[(cell, direction[1])] = result and (result[0], result[1] - i)
+
+        return result
+
+
+    def _is_passable(self, position:tuple[int, int]) -> bool:
+        """
+        Evaluates if a position is inside the maze and is not a wall.
+
+        Args:
+            position (tuple): a specific position within the maze.
+
+        Returns:
+            bool: True if the position can be entered.
+        """
+        return self.cells[(position[0] + 1) * self.width + position[1] + 1] != 0
+
+
+    def _is_empty(self, position:tuple[int, int]) -> bool:
+        """
+        Evaluates if a position is inside the maze and is an empty cell.
+
+        Args:
+            position (tuple): a specific position within the maze.
+
+        Returns:
+            bool: True if the position is an empty cell.
+        """
+        return self.cells[(position[0] + 1) * self.width + position[1] + 1] == self.empty
+
+
+    def _backtrack(self, node:tuple) -> list:
+        """
+        Backtracks from the goal to the start through the jump points and
+        fills the cells between them.
+
+        Args:
+            node (tuple): the node of the goal.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        path = [node[0]]
+
+        while self.node_parent[node] is not None:
+            (row, col), direction = node
+            node = self.node_parent[node]
+            while (row, col) != node[0]:
+                row, col = row - direction[0], col - direction[1]
+                path.append((row, col))
+
+        return path
+
+
+
+if __name__ == '__main__':
+
+    # Open the file with a matrix
+    maze = Maze('./data/matrix3.txt')
+
+    # Find the path from the start to the goal
+    jps = JPS(maze)
+    print("Solution JPS: ", jps.solve())
@@ -0,0 +1,251 @@
+from heapq import heappush, heappop
+from math import inf
+
+from constant import Constant
+from maze import Maze
+from tracer import Tracer
+
+
+
+class LPAStar(Constant):
+    """
+    Class that implements Lifelong Planning A* (LPA*), an incremental
+    version of A* for mazes whose cells change between searches.
+
+    Every cell keeps two estimates of the cost of its path from the start:
+    g, the one found by the last expansion, and rhs, the one computed from
+    the g of its neighbors. A cell whose estimates differ is inconsistent
+    and waits in the queue. When cells change, only their rhs is computed
+    again, so the next search only expands the cells whose cost changed,
+    instead of searching the whole maze again. The path found is optimal.
+
+    The cells are changed through the planner, which updates the maze:
+
+        planner = LPAStar(maze)
+        planner.solve()
+        planner.update({(3, 4): LPAStar.WALL})
+        planner.solve()
+    """
+
+    def __init__(self, maze:Maze, tracer:Tracer|None=None):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (Maze): Maze instance that represents the board, which is
+                         changed by update().
+            tracer (Tracer): observer of the searches, or None.
+        """
+        self.board = maze
+        self.maze = maze.maze
+        self.tracer = tracer
+
+        # The planner runs on the padded grid of the maze, which the maze
+        # keeps up to date when its cells change.
+        self.grid = maze.grid
+        self.width = self.grid.width
+        self.offsets = self.grid.offsets
+        self.start = self.grid.to_index(maze.start)
+        self.goal = self.grid.to_index(maze.goal)
+        self.goal_row, self.goal_col = divmod(self.goal, self.width)
+
+        self.order = []
+        self._initialize()
+
+
+    def solve(self) -> list|str:
+        """
+        Finds the path with the lowest cost, repairing the result of the
+        previous search if there was one.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        self.order = []
+        self._compute()
+        return self._backtrack()
+
+
+    def update(self, changes:dict[tuple[int, int], int]):
+        """
+        Changes the values of some cells of the maze, and marks the cells
+        whose estimates may have changed. The path is repaired on the next
+        call to solve().
+
+        Args:
+            changes (dict): the new value of every changed position.
+        """
+        changed = []
+        for position, value in changes.items():
+            if self.board.set_cell(position, value) != value:
+                changed.append(self.grid.to_index(position))
+
+        # The heuristic must not overestimate, so a cell cheaper than the
+        # cheapest move known makes it start over.
+        cells = self.grid.cells
+        if any(0 < cells[cell] <= self.min_cost and cell != self.start for cell in changed):
+            self._initialize()
+            return
+
+        # A move costs the value of the cell it enters, so only the estimate
+        # of the changed cells depends on their value.
+        for cell in changed:
+            self._update_cell(cell)
+
+
+    @property
+    def visited_list(self) -> list[tuple[int, int]]:
+        """
+        Returns:
+            (List): positions expanded by the last search, in order.
+        """
+        return [self.grid.to_position(cell) for cell in self.order]
+
+
+    @property
+    def cost_so_far(self) -> dict[tuple[int, int], int]:
+        """
+        Returns:
+            (Dict): cost of the path to each consistent reached position.
+        """
+        g, rhs = self.g, self.rhs
+        return {
+            self.grid.to_position(cell): int(g[cell]) for cell in range(len(g))
+            if g[cell] < inf and g[cell] == rhs[cell]
+        }
+
+
+    def _initialize(self):
+        """
+        Starts the planning from scratch: only the start is known, with a
+        cost of 0, and it is the only cell in the queue.
+        """
+        self.min_cost = self.grid.min_cost()
+        self.g = [inf] * self.grid.size
+        self.rhs = [inf] * self.grid.size
+        self.rhs[self.start] = 0
+        self.queue = []
+        self.queued = {}    # key of every cell in the queue
+        self.count = 0
+        self._push(self.start)
+
+
+    def _compute(self):
+        """
+        Expands the inconsistent cells in order of their keys until the goal
+        is consistent and no cell in the queue can give it a cheaper path.
+        """
+        g, rhs, queue, queued = self.g, self.rhs, self.queue, self.queued
+        cells, offsets, goal = self.grid.cells, self.offsets, self.goal
+        tracer = self.tracer
+
+        while queue:
+            key = queue[0][:2]
+            if g[goal] == rhs[goal] and key >= (g[goal], g[goal]):
+                break
+
+            _, _, _, current = heappop(queue)
+            if queued.get(current) != key:
+                continue  # Outdated entry of a cell that was pushed again.
+            del queued[current]
+
+            self.order.append(current)
+            if tracer is not None:
+                tracer.on_expand(self.grid.to_position(current), key[1])
+
+            if g[current] > rhs[current]:
+                # Overconsistent: the cell got cheaper, which is final.
+                g[current] = rhs[current]
+            else:
+                # Underconsistent: the cell got more expensive, so it and
+                # the cells that depend on it are computed again.
+                g[current] = inf
+                self._update_cell(current)
+            for offset in offsets:
+                # The walls and the border never get an estimate.
+                if cells[current + offset]:
+                    self._update_cell(current + offset)
+
+        if tracer is not None and g[goal] < inf:
+            tracer.on_goal(self.grid.to_position(goal))
+
+
+    def _update_cell(self, cell:int):
+        """
+        Computes again the rhs of a cell from the g of its neighbors, and
+        puts it in the queue if it is inconsistent or takes it out if not.
+
+        Args:
+            cell (int): a flat index of the padded grid.
+        """
+        g, rhs = self.g, self.rhs
+
+        if cell != self.start:
+            cost = self.grid.cells[cell]
+            if cost:
+                best = min(g[cell + offset] for offset in self.offsets)
+                rhs[cell] = best + cost - 1
+            else:
+                rhs[cell] = inf
+
+        if g[cell] != rhs[cell]:
+            self._push(cell)
+        else:
+            self.queued.pop(cell, None)
+
+
+    def _push(self, cell:int):
+        """
+        Puts a cell in the queue with its current key. A previous entry of
+        the cell is left in the heap and skipped when it is taken out.
+
+        Args:
+            cell (int): a flat index of the padded grid.
+        """
+        cost = min(self.g[cell], self.rhs[cell])
+        row, col = divmod(cell, self.width)
+        # The key is the estimated cost to the goal through the cell and,
+        # to break ties, its cost from the start. The heuristic is the
+        # Manhattan distance to the goal scaled by the minimum cost.
+        key = (cost + (abs(row - self.goal_row) + abs(col - self.goal_col)) * self.min_cost, cost)
+        if self.queued.get(cell) == key:
+            return
+        self.queued[cell] = key
+        self.count += 1
+        heappush(self.queue, (*key, self.count, cell))
+        if self.tracer is not None:
+            self.tracer.on_push(self.grid.to_position(cell), len(self.queued))
+
+
+    def _backtrack(self) -> list|str:
+        """
+        Follows from the goal the neighbors with the cheapest path, back to
+        the start.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        g = self.g
+        if g[self.goal] == inf:
+            return 'No existe una solución'
+
+        path = [self.grid.to_position(self.goal)]
+        current = self.goal
+        while current != self.start:
+            current = min((current + offset for offset in self.offsets), key=g.__getitem__)
+            path.append(self.grid.to_position(current))
+
+        return path
+
+
+
+if __name__ == '__main__':
+
+    # Open the file with a matrix
+    maze = Maze('./data/matrix.txt')
+
+    # Find the path from the start to the goal, and again after a change.
+    planner = LPAStar(maze)
+    print("Solution LPA*: ", planner.solve())
+    planner.update({planner.solve()[1]: LPAStar.WALL})
+    print("Solution LPA* con un muro nuevo: ", planner.solve())
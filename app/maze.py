@@ -1,29 +1,208 @@
 import numpy as np
 
 from constant import Constant
+from field import DistanceField
+from grid import Grid
+from mazeio import MazeIO
+from poi import DistanceMatrix
+
+
+
+class MatrixView:
+    """
+    Class that shows the numeric matrix of a maze as a list of rows without
+    copying it. Every row is converted to a list of integers when it is
+    accessed, so it can be iterated and indexed like the list it replaces.
+    """
+
+    def __init__(self, maze:np.ndarray):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (ndarray): the numeric matrix of the maze.
+        """
+        self.maze = maze
+
+
+    def __len__(self) -> int:
+        return len(self.maze)
+
+
+    def __getitem__(self, index):
+        return self.maze[index].tolist()
+
+
+    def __iter__(self):
+        for row in self.maze:
+            yield row.tolist()
+
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MatrixView):
+            other = other.maze
+        return np.array_equal(self.maze, np.asarray(other))
+
+
+    def tolist(self) -> list[list[int]]:
+        """
+        Returns:
+            (List): a copy of the numeric matrix as a list of rows.
+        """
+        return self.maze.tolist()
 
 
 
 class Maze(Constant):
     """
     Class that represents a maze.
+
+    The cells are stored as 8-bit integers when their values fit, which is
+    always the case for the constants. The solvers share a padded grid,
+    one byte per cell, with the neighbors of every cell; it is built when
+    first needed.
     """
 
-    def __init__(self, filename:str, matrix = None):
+    def __init__(self, filename:str, matrix = None, mmap:bool=False):
         """
         Initializes the class instance with a numeric matrix from a file.
+        Files ending in .maze are read in the binary format and any other
+        one in the text format.
 
         Args:
             filename (str): path to the file with the numeric matrix representing the maze.
+            mmap (bool): True to map the matrix from a binary or .npy file
+                         instead of reading it, so it can be larger than
+                         the memory. The mapping is read only.
         """
-        if not matrix is None:
-            self.maze = np.array(matrix)
-        else:
+        if matrix is None:
             # Load maze from file.
-            self.maze = np.loadtxt(filename, dtype=int)
-            
-        self.matrix = self.maze.tolist()
+            matrix, start, goal = MazeIO.load(filename, mmap)
+            self._set_matrix(matrix, start, goal)
+        else:
+            self.matrix = matrix
+
+
+    @property
+    def matrix(self) -> MatrixView:
+        """
+        Returns:
+            (MatrixView): the numeric matrix of the maze as a list of rows,
+                          which is a view of the matrix and not a copy.
+        """
+        return MatrixView(self.maze)
+
+
+    @matrix.setter
+    def matrix(self, matrix):
+        """
+        Replaces the numeric matrix of the maze and discards everything
+        computed from the previous one.
+
+        Args:
+            matrix (list|ndarray): the new numeric matrix.
+        """
+        self._set_matrix(MazeIO.compact(np.array(matrix)))
+
+
+    def _set_matrix(self, matrix:np.ndarray, start:tuple|None=None, goal:tuple|None=None):
+        """
+        Sets the numeric matrix of the maze and its start and goal positions.
+
+        Args:
+            matrix (ndarray): the numeric matrix, which is not copied.
+            start (tuple): Pinocchio's position, or None to look for it.
+            goal (tuple): Gepetto's position, or None to look for it.
+        """
+        self.maze = matrix
+        self._grid = None
+        self._fields = {}
 
         # Define the start and goal positions.
-        self.start = tuple(np.argwhere(self.maze == self.PINOCCHIO)[0])
-        self.goal = tuple(np.argwhere(self.maze == self.GEPETTO)[0])
\ No newline at end of file
+        if start is None:
+            start = tuple(np.argwhere(self.maze == self.PINOCCHIO)[0])
+        if goal is None:
+            goal = tuple(np.argwhere(self.maze == self.GEPETTO)[0])
+        # Keep the same integer type whether they were stored or looked for.
+        self.start = tuple(np.int64(value) for value in start)
+        self.goal = tuple(np.int64(value) for value in goal)
+
+
+    def set_cell(self, position:tuple[int, int], value:int) -> int:
+        """
+        Changes the value of a cell, for example to add a wall or to move a
+        fox. The padded grid is updated in place, and its adjacency and the
+        distance fields are discarded, so they are built again from the new
+        matrix when they are needed. Pinocchio and Gepetto stay where they
+        are.
+
+        Args:
+            position (tuple): a specific position within the maze.
+            value (int): the new value of the cell.
+
+        Returns:
+            (int): the previous value of the cell.
+        """
+        row, col = int(position[0]), int(position[1])
+        if not self.maze.flags.writeable:
+            raise ValueError('The maze is read only')
+        if not (0 <= row < self.maze.shape[0] and 0 <= col < self.maze.shape[1]):
+            raise ValueError(f'The position {(row, col)} is outside the maze')
+        if not self.WALL <= value <= min(np.iinfo(self.maze.dtype).max, 254):
+            raise ValueError(f'The value {value} is not valid for a cell')
+
+        previous = int(self.maze[row, col])
+        if previous == value:
+            return previous
+
+        self.maze[row, col] = value
+        if self._grid is not None:
+            self._grid.update((row, col), value)
+        self._fields = {}
+        return previous
+
+
+    @property
+    def grid(self) -> Grid:
+        """
+        Returns:
+            (Grid): the maze padded with walls and flattened, shared by the
+                    solvers. It is built the first time it is needed.
+        """
+        if self._grid is None:
+            self._grid = Grid(self.maze)
+        return self._grid
+
+
+    def distance_field(self, weighted:bool=True):
+        """
+        Returns the distance from every cell to the goal and the next move
+        to take from each one. It is built once and kept until the matrix
+        changes.
+
+        Args:
+            weighted (bool): True to use the cost of the cells, False to
+                             count the moves.
+
+        Returns:
+            (DistanceField): the distance field of the maze.
+        """
+        if weighted not in self._fields:
+            self._fields[weighted] = DistanceField(self, weighted)
+        return self._fields[weighted]
+
+
+    def distance_matrix(self, points:list|None=None, paths:bool=False) -> DistanceMatrix:
+        """
+        Computes the cost of the shortest path between every pair of points
+        of interest, searching from all of them in batches.
+
+        Args:
+            points (list): positions of the points, all of Pinocchio,
+                           Gepetto, the cigars and the foxes by default.
+            paths (bool): True to keep the paths between the points.
+
+        Returns:
+            (DistanceMatrix): the distances between the points.
+        """
+        return DistanceMatrix(self, points, paths)
@@ -0,0 +1,321 @@
+import os
+import struct
+import sys
+
+import numpy as np
+
+from constant import Constant
+
+
+
+class MazeIO(Constant):
+    """
+    Class that reads and writes the mazes in two formats:
+
+        text: the numeric matrix with one row per line and the values
+              separated by spaces, as in the data folder.
+        binary (.maze): a header with the shape, the type of the values and
+              the start and goal positions, followed by the raw matrix, so
+              it is loaded with a single read.
+
+    The values are kept as 8-bit integers when they fit, which is the case
+    for every maze made of the constants.
+    """
+
+    # Magic number, type of the values, rows, columns, start and goal.
+    HEADER = struct.Struct('<4s4s6q')
+    MAGIC = b'PMZ1'
+    # The matrix starts at this offset, so it is aligned for memory mapping.
+    OFFSET = 64
+    BINARY = '.maze'
+
+    @classmethod
+    def load(cls, filename:str, mmap:bool=False) -> tuple:
+        """
+        Loads a maze, choosing the format by the extension of the file.
+
+        Args:
+            filename (str): path to the file with the maze.
+            mmap (bool): True to map the matrix from the file instead of
+                         reading it, which only the binary and .npy files
+                         allow.
+
+        Returns:
+            (tuple): the numeric matrix and the start and goal positions,
+                     which are None when the file does not store them.
+        """
+        extension = os.path.splitext(filename)[1].lower()
+        if extension == cls.BINARY:
+            return cls.read_binary(filename, mmap)
+        if extension == '.npy':
+            return np.load(filename, mmap_mode='r' if mmap else None), None, None
+        if mmap:
+            raise ValueError(f'Only {cls.BINARY} and .npy mazes can be memory mapped')
+        return cls.read_text(filename), None, None
+
+
+    @classmethod
+    def read_text(cls, filename:str) -> np.ndarray:
+        """
+        Reads a maze in the text format.
+
+        Args:
+            filename (str): path to the text file.
+
+        Returns:
+            (ndarray): the numeric matrix.
+        """
+        with open(filename, 'rb') as file:
+            return cls.parse_text(file.read())
+
+
+    @classmethod
+    def parse_text(cls, data:bytes) -> np.ndarray:
+        """
+        Parses the text format without a Python loop: the numbers are found
+        as the runs of digits of the bytes, and each one is placed in the
+        row of the line it is on.
+
+        Args:
+            data (bytes): the content of a text file.
+
+        Returns:
+            (ndarray): the numeric matrix.
+        """
+        text = np.frombuffer(data, dtype=np.uint8)
+
+        # The bytes below '0' wrap around, so only the digits are under 10.
+        digit = (text - np.uint8(ord('0'))) < 10
+        valid = digit.copy()
+        for character in b' \t\r\n-':
+            valid |= text == character
+        if not valid.all():
+            position = int(np.argmin(valid))
+            raise ValueError(f'Unexpected character {data[position:position + 1]!r} at byte {position}')
+
+        matrix = cls._parse_columns(text, digit)
+        if matrix is not None:
+            return matrix
+
+        # A number starts where a digit follows a non-digit and ends where
+        # a non-digit follows a digit.
+        edges = np.diff(digit.view(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        if not len(starts):
+            raise ValueError('The maze is empty')
+
+        lengths = ends - starts
+        values = (text[starts] - ord('0')).astype(np.int64)
+        for offset in range(1, int(lengths.max())):
+            longer = lengths > offset
+            values[longer] = values[longer] * 10 + (text[starts[longer] + offset] - ord('0'))
+
+        negative = np.zeros(len(starts), dtype=bool)
+        negative[starts > 0] = text[starts[starts > 0] - 1] == ord('-')
+        values[negative] *= -1
+
+        # Every line with numbers is a row, and all of them must be as long.
+        newlines = np.append(np.flatnonzero(text == ord('\n')), len(text))
+        counts = np.diff(np.searchsorted(starts, newlines), prepend=0)
+        counts = counts[counts > 0]
+        if (counts != counts[0]).any():
+            row = int(np.argmax(counts != counts[0]))
+            raise ValueError(f'Row {row} has {counts[row]} values instead of {counts[0]}')
+
+        return cls.compact(values.reshape(len(counts), counts[0]))
+
+
+    @classmethod
+    def _parse_columns(cls, text:np.ndarray, digit:np.ndarray) -> np.ndarray|None:
+        """
+        Parses the common case of the text format in which all the lines are
+        equally long and every value is a single digit in the same column of
+        every line. The lines are then the rows of a 2D array of bytes and
+        the values are read by column.
+
+        Args:
+            text (ndarray): the bytes of the text.
+            digit (ndarray): True for the bytes that are digits.
+
+        Returns:
+            (ndarray): the numeric matrix, or None if the text is not laid
+                       out in columns.
+        """
+        width = int(np.argmax(text == ord('\n'))) + 1
+        if text[width - 1] != ord('\n') or len(text) % width:
+            return None
+
+        lines = text.reshape(-1, width)
+        digit = digit.reshape(-1, width)
+        columns = np.flatnonzero(digit[0])
+
+        if (
+            not len(columns)
+            or (np.diff(columns) == 1).any()
+            or not (lines[:, -1] == ord('\n')).all()
+            or not (digit == digit[0]).all()
+        ):
+            return None
+
+        # The sign of a value is right before its digit. The index of the
+        # sign of a value in the first byte of a line wraps around to the
+        # end of the line, which is never a sign.
+        steps = np.diff(columns)
+        if len(steps) and (steps == steps[0]).all():
+            # Equally spaced columns are read with slices instead of indexes.
+            first, last, step = columns[0], columns[-1], steps[0]
+            values = lines[:, first:last + 1:step].astype(np.int8) - np.int8(ord('0'))
+            skip = 0 if first else 1
+            signs = lines[:, first - 1 + skip * step:last:step] == ord('-')
+            values[:, skip:][signs] *= -1
+        else:
+            values = lines[:, columns].astype(np.int8) - np.int8(ord('0'))
+            values[lines[:, columns - 1] == ord('-')] *= -1
+
+        return values
+
+
+    @classmethod
+    def read_binary(cls, filename:str, mmap:bool=False) -> tuple:
+        """
+        Reads a maze in the binary format.
+
+        Args:
+            filename (str): path to the binary file.
+            mmap (bool): True to map the matrix from the file instead of
+                         reading it into memory.
+
+        Returns:
+            (tuple): the numeric matrix and the start and goal positions.
+        """
+        with open(filename, 'rb') as file:
+            header = file.read(cls.HEADER.size)
+
+        if len(header) < cls.HEADER.size:
+            raise ValueError(f'{filename} is not a binary maze')
+        magic, dtype, rows, cols, *positions = cls.HEADER.unpack(header)
+        if magic != cls.MAGIC:
+            raise ValueError(f'{filename} is not a binary maze')
+
+        dtype = np.dtype(dtype.rstrip(b'\0').decode())
+        if mmap:
+            matrix = np.memmap(filename, dtype, 'r', offset=cls.OFFSET, shape=(rows, cols))
+        else:
+            matrix = np.fromfile(filename, dtype, count=rows * cols, offset=cls.OFFSET)
+            if matrix.size != rows * cols:
+                raise ValueError(f'{filename} is truncated')
+            matrix = matrix.reshape(rows, cols)
+
+        start = tuple(positions[:2]) if positions[0] >= 0 else None
+        goal = tuple(positions[2:]) if positions[2] >= 0 else None
+        return matrix, start, goal
+
+
+    @classmethod
+    def write_binary(cls, filename:str, matrix, start:tuple|None=None, goal:tuple|None=None):
+        """
+        Writes a maze in the binary format.
+
+        Args:
+            filename (str): path to the binary file.
+            matrix (list|ndarray): the numeric matrix.
+            start (tuple): Pinocchio's position, or None to look for it.
+            goal (tuple): Gepetto's position, or None to look for it.
+        """
+        matrix = cls.compact(np.asarray(matrix))
+        start = start if start is not None else cls._find(matrix, cls.PINOCCHIO)
+        goal = goal if goal is not None else cls._find(matrix, cls.GEPETTO)
+
+        header = cls.HEADER.pack(cls.MAGIC, matrix.dtype.str.encode(), *matrix.shape, *start, *goal)
+        with open(filename, 'wb') as file:
+            file.write(header.ljust(cls.OFFSET, b'\0'))
+            np.ascontiguousarray(matrix).tofile(file)
+
+
+    @classmethod
+    def write_text(cls, filename:str, matrix):
+        """
+        Writes a maze in the text format, with every value two characters
+        wide like the files of the data folder.
+
+        Args:
+            filename (str): path to the text file.
+            matrix (list|ndarray): the numeric matrix.
+        """
+        matrix = np.asarray(matrix)
+
+        if matrix.min() < -9 or matrix.max() > 9:
+            np.savetxt(filename, matrix, fmt='%2d')
+            return
+
+        # Every value takes a separator, a sign and a digit; the separator
+        # of the first column becomes the end of the line.
+        text = np.full(matrix.shape + (3,), ord(' '), dtype=np.uint8)
+        text[..., 1][matrix < 0] = ord('-')
+        text[..., 2] = np.abs(matrix) + ord('0')
+        text = text.reshape(matrix.shape[0], -1)
+        text = np.concatenate([text[:, 1:], np.full((len(text), 1), ord('\n'), dtype=np.uint8)], axis=1)
+
+        with open(filename, 'wb') as file:
+            file.write(text.tobytes())
+
+
+    @classmethod
+    def convert(cls, source:str, target:str):
+        """
+        Converts a maze between the formats, choosing them by the extension
+        of the files.
+
+        Args:
+            source (str): path to the file to read.
+            target (str): path to the file to write.
+        """
+        matrix, start, goal = cls.load(source)
+        if os.path.splitext(target)[1].lower() == cls.BINARY:
+            cls.write_binary(target, matrix, start, goal)
+        else:
+            cls.write_text(target, matrix)
+
+
+    @staticmethod
+    def compact(matrix:np.ndarray) -> np.ndarray:
+        """
+        Stores the values in 8-bit integers when they fit, or in 32-bit ones.
+
+        Args:
+            matrix (ndarray): the numeric matrix.
+
+        Returns:
+            (ndarray): the matrix with the smallest type that holds it.
+        """
+        if matrix.size and -128 <= matrix.min() and matrix.max() <= 127:
+            return matrix.astype(np.int8, copy=False)
+        return matrix.astype(np.int32, copy=False)
+
+
+    @staticmethod
+    def _find(matrix:np.ndarray, value:int) -> tuple:
+        """
+        Finds the first cell with a value.
+
+        Args:
+            matrix (ndarray): the numeric matrix.
+            value (int): the value to look for.
+
+        Returns:
+            (tuple): the position of the cell, or (-1, -1) if there is none.
+        """
+        flat = np.flatnonzero(matrix.ravel() == value)
+        if not len(flat):
+            return (-1, -1)
+        return tuple(int(index) for index in np.unravel_index(flat[0], matrix.shape))
+
+
+
+if __name__ == '__main__':
+
+    # Convert a maze between the text and the binary formats.
+    if len(sys.argv) != 3:
+        sys.exit('Usage: python mazeio.py source target')
+    MazeIO.convert(sys.argv[1], sys.argv[2])
@@ -0,0 +1,234 @@
+import numpy as np
+
+from constant import Constant
+
+
+
+class DistanceMatrix(Constant):
+    """
+    Class that represents the cost of the shortest path between every pair
+    of points of interest of a maze, and optionally the paths themselves.
+
+    The searches from all the points run together: a batch of sources is
+    searched in a single pass of Dial's algorithm, over a distance array
+    with a row per source, so every level of the search expands the cells
+    of all the sources of the batch with the same NumPy operations. The
+    batches have up to BATCH sources, fewer if the memory limit requires
+    it, and each one stops when every point has been reached from all its
+    sources.
+
+    The cost of a path is the sum of the values of the cells entered after
+    its first one, like in UCS, so the matrix is not symmetric.
+    """
+
+    # Kinds of cells that are points of interest by default.
+    KINDS = (Constant.PINOCCHIO, Constant.GEPETTO, Constant.CIGAR, Constant.FOX)
+
+    # Most sources searched together. Larger batches share more of the
+    # work, but their arrays stop fitting in the caches of the processor.
+    BATCH = 16
+
+    def __init__(self, maze, points:list|None=None, paths:bool=False,
+                 memory:int=2**28):
+        """
+        Initializes the class instance and computes the matrix.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+            points (list): positions of the points, all the cells of the
+                           kinds in KINDS by default.
+            paths (bool): True to keep the moves of every search, so the
+                          paths can be rebuilt with path().
+            memory (int): bytes that the arrays of a batch can take, which
+                          limits the batches of very large mazes.
+        """
+        self.grid = maze.grid
+        if points is None:
+            points = self.find(maze.maze)
+        self.points = [(int(row), int(col)) for row, col in points]
+        self.paths = paths
+        self.parents = []
+
+        cells = np.array([self.grid.to_index(point) for point in self.points], dtype=np.int64)
+        if len(cells) and not np.all(self.grid.codes[cells]):
+            raise ValueError('A point of interest is a wall')
+
+        # Every batch needs the distance, a stamp, and the move of the paths,
+        # of every cell for each of its sources.
+        per_source = self.grid.size * (8 + (1 if paths else 0))
+        batch = max(1, min(len(cells), self.BATCH, memory // per_source))
+
+        self.distances = np.full((len(cells), len(cells)), -1, dtype=np.int64)
+        for first in range(0, len(cells), batch):
+            self.distances[first:first + batch] = self._search(cells[first:first + batch], cells)
+
+
+    @classmethod
+    def find(cls, matrix:np.ndarray, kinds:tuple|None=None) -> list[tuple[int, int]]:
+        """
+        Finds all the cells of some kinds.
+
+        Args:
+            matrix (ndarray): numeric matrix of the maze.
+            kinds (tuple): the values of the cells to find, KINDS by default.
+
+        Returns:
+            (List): the positions of the cells, by rows.
+        """
+        kinds = cls.KINDS if kinds is None else kinds
+        return [tuple(position) for position in np.argwhere(np.isin(matrix, kinds)).tolist()]
+
+
+    def distance(self, source:int, target:int) -> int|None:
+        """
+        Returns the cost of the shortest path between two points.
+
+        Args:
+            source (int): index of the first point in points.
+            target (int): index of the last point in points.
+
+        Returns:
+            (int): the cost of the path, or None if there is none.
+        """
+        distance = int(self.distances[source, target])
+        return None if distance < 0 else distance
+
+
+    def path(self, source:int, target:int) -> list|str:
+        """
+        Rebuilds the shortest path between two points following back the
+        moves of the search from the first one.
+
+        Args:
+            source (int): index of the first point in points.
+            target (int): index of the last point in points.
+
+        Returns:
+            (List): path from the target position to the source position.
+        """
+        if not self.paths:
+            raise ValueError('The paths were not kept, create the matrix with paths=True')
+        if self.distances[source, target] < 0:
+            return 'No existe una solución'
+
+        parent = self.parents[source]
+        start = self.grid.to_index(self.points[source])
+        current = self.grid.to_index(self.points[target])
+
+        path = [self.grid.to_position(current)]
+        while current != start:
+            current -= self.grid.offsets[parent[current]]
+            path.append(self.grid.to_position(current))
+
+        return path
+
+
+    def _search(self, sources:np.ndarray, targets:np.ndarray) -> np.ndarray:
+        """
+        Runs Dial's algorithm from a batch of sources at once. A cell of
+        the search is identified by its row, the index of its source in the
+        batch, and its cell, as row * size + cell.
+
+        Args:
+            sources (ndarray): flat indices of the sources of the batch.
+            targets (ndarray): flat indices of all the points.
+
+        Returns:
+            (ndarray): the distance from every source to every point, or -1
+                       if it is not reachable.
+        """
+        size = self.grid.size
+        codes = self.grid.codes
+
+        distance = np.full(len(sources) * size, -1, dtype=np.int32)
+        parent = np.full(len(sources) * size, -1, dtype=np.int8) if self.paths else None
+        stamp = np.empty(len(sources) * size, dtype=np.int32)
+
+        # The distance of every point from every source, as cells of the search.
+        wanted = (np.arange(len(sources))[:, None] * size + targets).ravel()
+
+        starts = np.arange(len(sources)) * size + sources
+        distance[starts] = 0
+        buckets = {0: [starts]}
+        current = 0
+
+        while buckets:
+            while current not in buckets:
+                current += 1
+
+            # Moves into Pinocchio cost nothing, so the bucket can grow while
+            # it is being processed.
+            while buckets.get(current):
+                keys = np.concatenate(buckets.pop(current))
+                keys = keys[distance[keys] == current]
+                keys = keys[self._once(stamp, keys)]
+                if not len(keys):
+                    continue
+
+                rows, cells = np.divmod(keys, size)
+                moves_of, moves, neighbors = self.grid.neighbors(cells)
+                new_keys = rows[moves_of] * size + neighbors
+                # The byte of a cell is its value plus one.
+                new_distance = current - 1 + codes[neighbors].astype(np.int32)
+
+                valid = (distance[new_keys] < 0) | (new_distance < distance[new_keys])
+                new_keys, moves, new_distance = new_keys[valid], moves[valid], new_distance[valid]
+
+                # A cell reached from several cells keeps one of the moves,
+                # and the cost of all of them is the same, since it only
+                # depends on the cell.
+                once = self._once(stamp, new_keys)
+                new_keys, moves, new_distance = new_keys[once], moves[once], new_distance[once]
+
+                distance[new_keys] = new_distance
+                if parent is not None:
+                    parent[new_keys] = moves
+                for cost in np.unique(new_distance).tolist():
+                    buckets.setdefault(cost, []).append(new_keys[new_distance == cost])
+
+            buckets.pop(current, None)
+
+            # The distances up to the current cost are final, so the batch
+            # is done once all the points are within them.
+            reached = distance[wanted]
+            if np.all((0 <= reached) & (reached <= current)):
+                break
+
+        if parent is not None:
+            self.parents.extend(parent.reshape(len(sources), size))
+        return distance[wanted].reshape(len(sources), len(targets))
+
+
+    @staticmethod
+    def _once(stamp:np.ndarray, keys:np.ndarray) -> np.ndarray:
+        """
+        Picks one entry of every key without sorting them: every entry
+        writes its position in the stamp array, and only one write of each
+        key is kept, so only one of its entries finds its own position.
+
+        Args:
+            stamp (ndarray): array with an entry for every possible key,
+                             whose values are overwritten.
+            keys (ndarray): the keys, which may be repeated.
+
+        Returns:
+            (ndarray): True for one entry of each key.
+        """
+        positions = np.arange(len(keys), dtype=np.int32)
+        stamp[keys] = positions
+        return stamp[keys] == positions
+
+
+
+if __name__ == '__main__':
+
+    from maze import Maze
+
+    # Open the file with a matrix
+    maze = Maze('./data/matrix.txt')
+
+    # Find the distances between all the points of interest.
+    matrix = maze.distance_matrix(paths=True)
+    print("Puntos de interés: ", matrix.points)
+    print("Distancias:\n", matrix.distances)
+    print("Camino del primero al último: ", matrix.path(0, len(matrix.points) - 1))
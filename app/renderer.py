@@ -0,0 +1,545 @@
+import math
+import os
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageTk
+
+from constant import Constant
+from maze import Maze
+
+
+
+class Sprites(Constant):
+    """
+    Class that keeps the images of the board. Every image is read from disk
+    once, and scaled once for every size it is shown at.
+    """
+
+    DIRECTORY = './images'
+
+    FILES = {
+        Constant.WALL: 'fondo.png',
+        Constant.PINOCCHIO: 'pinocho.png',
+        Constant.EMPTY: 'suelo.png',
+        Constant.CIGAR: 'cigarro.png',
+        Constant.FOX: 'zorro.png',
+        Constant.GEPETTO: 'gepeto.png',
+    }
+
+    def __init__(self):
+        """
+        Initializes the class instance.
+        """
+        self.originals = {}
+        self.scaled = {}
+
+
+    def image(self, value:int, size:int) -> Image.Image:
+        """
+        Returns the image of a kind of cell scaled to a size.
+
+        Args:
+            value (int): numeric value of the cell.
+            size (int): side of the image in pixels.
+
+        Returns:
+            (Image): the scaled image.
+        """
+        if value not in self.originals:
+            with Image.open(os.path.join(self.DIRECTORY, self.FILES[value])) as image:
+                self.originals[value] = image.convert('RGBA')
+
+        key = (value, size)
+        if key not in self.scaled:
+            self.scaled[key] = self.originals[value].resize((size, size))
+        return self.scaled[key]
+
+
+    def photo(self, value:int, size:int) -> ImageTk.PhotoImage:
+        """
+        Returns the image of a kind of cell scaled to a size, ready to be
+        placed on a Tk canvas. A Tk window must exist.
+
+        Args:
+            value (int): numeric value of the cell.
+            size (int): side of the image in pixels.
+
+        Returns:
+            (PhotoImage): the scaled image.
+        """
+        key = ('photo', value, size)
+        if key not in self.scaled:
+            self.scaled[key] = ImageTk.PhotoImage(self.image(value, size))
+        return self.scaled[key]
+
+
+
+class CanvasRenderer(Constant):
+    """
+    Class that draws the board on a Tk canvas with a fixed set of items: a
+    square, a text for the cost and an image for every cell, and a border
+    around the board. They are created once per maze, and the animation
+    only changes the ones of the cells that change, so every step costs
+    the same no matter the size of the board.
+    """
+
+    def __init__(self, canvas, colors:dict, size:int, sprites:Sprites|None=None):
+        """
+        Initializes the class instance.
+
+        Args:
+            canvas (Canvas): the Tk canvas to draw on.
+            colors (dict): colors of the board, by name.
+            size (int): side of the cells in pixels.
+            sprites (Sprites): the images of the cells, shared between
+                               renderers.
+        """
+        self.canvas = canvas
+        self.colors = colors
+        self.size = size
+        self.sprites = sprites or Sprites()
+        self.maze = None
+        self.squares = {}
+        self.texts = {}
+        self.painted = set()
+
+
+    def detach(self):
+        """
+        Forgets the maze shown, so the next one is drawn from scratch.
+        """
+        self.maze = None
+
+
+    def draw(self, maze:Maze):
+        """
+        Shows a maze. The items are created again only if the maze is not
+        the one already shown; otherwise they are just cleaned.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+        """
+        if self.maze is maze.maze:
+            self.reset()
+            return
+
+        self.canvas.delete('all')
+        self.squares.clear()
+        self.texts.clear()
+        self.painted.clear()
+        self.maze = maze.maze
+
+        size = self.size
+        rows, cols = maze.maze.shape
+
+        for i, row in enumerate(maze.matrix):
+            for j, value in enumerate(row):
+                x1, y1 = (j * size), (i * size)
+                self.squares[(i, j)] = self.canvas.create_rectangle(
+                    x1, y1, x1 + size, y1 + size,
+                    fill=self._background(value), outline=self.colors['border'])
+                self.texts[(i, j)] = self.canvas.create_text(
+                    x1 + size / 2, y1 + size / 2, text='', font=('Arial', 11))
+                self.canvas.create_image(
+                    x1, y1, image=self.sprites.photo(value, size), anchor='nw')
+
+        self.canvas.create_rectangle(
+            3, 3, cols * size, rows * size, fill='', outline=self.colors['border'], width=2)
+
+
+    def reset(self):
+        """
+        Restores the color of the painted cells and removes their costs.
+        """
+        for cell in self.painted:
+            self.canvas.itemconfig(self.squares[cell], fill=self._background(self.maze[cell]))
+            self.canvas.itemconfig(self.texts[cell], text='')
+        self.painted.clear()
+
+
+    def paint(self, cell:tuple[int, int], color:str, text:str|int|None=None):
+        """
+        Changes the color of a cell and optionally its text.
+
+        Args:
+            cell (tuple): position of the cell.
+            color (str): name of the color, one of the colors of the board.
+            text (str|int): the text to show on the cell, or None to keep it.
+        """
+        cell = (int(cell[0]), int(cell[1]))
+        self.painted.add(cell)
+        self.canvas.itemconfig(self.squares[cell], fill=self.colors[color])
+        if text is not None:
+            self.canvas.itemconfig(self.texts[cell], text=text)
+
+
+    def _background(self, value:int) -> str:
+        """
+        Args:
+            value (int): numeric value of the cell.
+
+        Returns:
+            (str): the color of a cell before the search.
+        """
+        return self.colors['wall'] if value == self.WALL else self.colors['empty']
+
+
+
+class BitmapRenderer(Constant):
+    """
+    Class that draws the board as a single image for the boards too large
+    to have canvas items for every cell.
+
+    The colors of the cells come from NumPy arrays: the values of the maze
+    and one byte per cell with its state in the animation (not visited,
+    visited or on the path). Only the part of the board inside the view is
+    turned into an image, with PIL, and shown on a single canvas item, so
+    drawing costs the same no matter the size of the board. The changes of
+    an animation frame are drawn together when Tk is idle.
+
+    The view is zoomed with Control and the mouse wheel, scrolled with the
+    wheel (Shift for horizontal) and dragged with the left button. Zooms
+    under one pixel per cell show one cell of every block, keeping the
+    visited and path ones.
+    """
+
+    # Pixels per cell of every zoom level.
+    ZOOMS = (1 / 16, 1 / 8, 1 / 4, 1 / 2, 1, 2, 4, 8, 16, 32, 60)
+    # Zooms from which the sprites and the costs are drawn.
+    SPRITE_ZOOM = 16
+    TEXT_ZOOM = 32
+
+    STATES = {'visited': 1, 'path': 2}
+
+    def __init__(self, canvas, colors:dict, size:int, sprites:Sprites|None=None,
+                 view:tuple[int, int]=(960, 720)):
+        """
+        Initializes the class instance.
+
+        Args:
+            canvas (Canvas): the Tk canvas to draw on.
+            colors (dict): colors of the board, by name.
+            size (int): largest side of the cells in pixels.
+            sprites (Sprites): the images of the cells, shared between
+                               renderers.
+            view (tuple): largest width and height of the view in pixels.
+        """
+        self.canvas = canvas
+        self.colors = colors
+        self.size = size
+        self.sprites = sprites or Sprites()
+        self.view = view
+        self.maze = None
+        self.item = None
+        self.photo = None
+        self.job = None
+        self.drag = None
+
+        # The color of every value over every state, for the zooms without
+        # sprites: the background of the state with the mean color of the
+        # sprite blended on it, and Pinocchio and Gepetto in their own color.
+        backgrounds = [self._rgb(colors[name]) for name in ('empty', 'visited', 'path')]
+        self.palette = np.zeros((len(backgrounds), len(self.sprites.FILES), 3), dtype=np.uint8)
+        for value in self.sprites.FILES:
+            sprite = np.asarray(self.sprites.image(value, 8), dtype=np.float32).reshape(-1, 4) / 255
+            alpha = 1 if value in (self.PINOCCHIO, self.GEPETTO) else sprite[:, 3].mean()
+            color = (sprite[:, :3] * sprite[:, 3:]).sum(axis=0) / max(sprite[:, 3].sum(), 1e-6) * 255
+            for state, background in enumerate(backgrounds):
+                if value == self.WALL:
+                    background = self._rgb(colors['wall'])
+                self.palette[state, value - self.WALL] = background * (1 - alpha) + color * alpha
+
+
+    def draw(self, maze:Maze):
+        """
+        Shows a maze, fitting it in the view. If it is the one already shown,
+        its cells are just cleaned.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+        """
+        if self.maze is maze.maze:
+            self.reset()
+            return
+
+        self.maze = maze.maze
+        self.start, self.goal = maze.start, maze.goal
+        self.state = np.zeros(self.maze.shape, dtype=np.uint8)
+        self.texts = {}
+
+        # Take the largest zoom at which the whole board fits in the view.
+        rows, cols = self.maze.shape
+        fits = [zoom for zoom in self.ZOOMS if zoom <= self.size
+                and cols * zoom <= self.view[0] and rows * zoom <= self.view[1]]
+        self.zoom = max(fits) if fits else self.ZOOMS[0]
+        self.top = self.left = 0
+
+        self.width = int(min(self.view[0], math.ceil(cols * self.zoom)))
+        self.height = int(min(self.view[1], math.ceil(rows * self.zoom)))
+        self.canvas.delete('all')
+        self.canvas.config(width=self.width, height=self.height)
+        self.item = self.canvas.create_image(0, 0, anchor='nw')
+        self.photo = None
+        self._bind()
+        self.refresh()
+
+
+    def detach(self):
+        """
+        Stops answering the events of the canvas and forgets the maze shown.
+        """
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>', '<ButtonPress-1>', '<B1-Motion>'):
+            self.canvas.unbind(sequence)
+        if self.job is not None:
+            self.canvas.after_cancel(self.job)
+            self.job = None
+        self.maze = None
+
+
+    def reset(self):
+        """
+        Removes the visited and path cells and the costs.
+        """
+        self.state[...] = 0
+        self.texts.clear()
+        self.refresh()
+
+
+    def paint(self, cell:tuple[int, int], color:str, text:str|int|None=None):
+        """
+        Changes the state of a cell and optionally its text. The view is
+        drawn again when Tk is idle.
+
+        Args:
+            cell (tuple): position of the cell.
+            color (str): 'visited' or 'path'.
+            text (str|int): the text to show on the cell, or None to keep it.
+        """
+        cell = (int(cell[0]), int(cell[1]))
+        self.state[cell] = self.STATES[color]
+        if text is not None:
+            self.texts[cell] = text
+        self.refresh()
+
+
+    def refresh(self):
+        """
+        Schedules the view to be drawn again, once for all the changes made
+        until Tk is idle.
+        """
+        if self.job is None:
+            self.job = self.canvas.after_idle(self._render)
+
+
+    def zoom_by(self, steps:int, x:int=0, y:int=0):
+        """
+        Changes the zoom, keeping the cell under a point of the view in place.
+
+        Args:
+            steps (int): number of zoom levels to go in (positive) or out.
+            x (int): horizontal coordinate of the point in the view.
+            y (int): vertical coordinate of the point in the view.
+        """
+        level = self.ZOOMS.index(self.zoom) + steps
+        zoom = self.ZOOMS[min(max(level, 0), len(self.ZOOMS) - 1)]
+
+        row, col = self.top + y / self.zoom, self.left + x / self.zoom
+        self.zoom = zoom
+        self.scroll_to(row - y / zoom, col - x / zoom)
+
+
+    def scroll_by(self, rows:float, cols:float):
+        """
+        Moves the view a number of cells.
+
+        Args:
+            rows (float): cells to move down (positive) or up.
+            cols (float): cells to move right (positive) or left.
+        """
+        self.scroll_to(self.top + rows, self.left + cols)
+
+
+    def scroll_to(self, top:float, left:float):
+        """
+        Moves the view so a cell is on its top left corner, keeping the view
+        inside the board.
+
+        Args:
+            top (float): row of the cell.
+            left (float): column of the cell.
+        """
+        rows, cols = self.maze.shape
+        self.top = int(min(max(top, 0), max(rows - self.height / self.zoom, 0)))
+        self.left = int(min(max(left, 0), max(cols - self.width / self.zoom, 0)))
+        self.refresh()
+
+
+    def render(self) -> Image.Image:
+        """
+        Builds the image of the part of the board inside the view.
+
+        Returns:
+            (Image): the image of the view.
+        """
+        if self.zoom >= 1:
+            zoom = int(self.zoom)
+            rows = (slice(self.top, self.top + math.ceil(self.height / zoom)))
+            cols = (slice(self.left, self.left + math.ceil(self.width / zoom)))
+            values, state = self.maze[rows, cols], self.state[rows, cols]
+            if zoom >= self.SPRITE_ZOOM:
+                pixels = self._sprites(values, state, zoom)
+            else:
+                pixels = self.palette[state, values - self.WALL]
+                pixels = pixels.repeat(zoom, axis=0).repeat(zoom, axis=1)
+        else:
+            pixels = self._blocks(int(round(1 / self.zoom)))
+
+        image = Image.fromarray(np.ascontiguousarray(pixels[:self.height, :self.width]))
+        if self.zoom >= self.TEXT_ZOOM and self.texts:
+            self._draw_texts(image, int(self.zoom))
+        return image
+
+
+    def _render(self):
+        """
+        Shows the image of the view on the canvas.
+        """
+        self.job = None
+        if self.maze is None:
+            return
+
+        image = self.render()
+        if self.photo is not None and (self.photo.width(), self.photo.height()) == image.size:
+            self.photo.paste(image)
+        else:
+            self.photo = ImageTk.PhotoImage(image)
+            self.canvas.itemconfig(self.item, image=self.photo)
+
+
+    def _sprites(self, values:np.ndarray, state:np.ndarray, zoom:int) -> np.ndarray:
+        """
+        Blends the sprites of the cells over the colors of their states,
+        and draws the border of the cells.
+
+        Args:
+            values (ndarray): values of the cells in the view.
+            state (ndarray): states of the cells in the view.
+            zoom (int): pixels per cell.
+
+        Returns:
+            (ndarray): the pixels of the view.
+        """
+        sprites = np.stack([
+            np.asarray(self.sprites.image(value, zoom), dtype=np.float32) / 255
+            for value in sorted(self.sprites.FILES)
+        ])
+        backgrounds = np.array([
+            self._rgb(self.colors[name]) for name in ('empty', 'visited', 'path')
+        ], dtype=np.float32)
+        backgrounds = np.where((values == self.WALL)[..., None], self._rgb(self.colors['wall']), backgrounds[state])
+
+        sprite = sprites[values - self.WALL]
+        alpha = sprite[..., 3:]
+        pixels = backgrounds[:, :, None, None, :] * (1 - alpha) + sprite[..., :3] * 255 * alpha
+
+        rows, cols = values.shape
+        pixels = pixels.astype(np.uint8).transpose(0, 2, 1, 3, 4).reshape(rows * zoom, cols * zoom, 3)
+        pixels[::zoom, :] = pixels[:, ::zoom] = self._rgb(self.colors['border'])
+        return pixels
+
+
+    def _blocks(self, step:int) -> np.ndarray:
+        """
+        Draws a pixel for every block of cells, with the color of its first
+        cell, unless a cell of the block is on the path or visited, or is
+        Pinocchio or Gepetto.
+
+        Args:
+            step (int): side of the blocks in cells.
+
+        Returns:
+            (ndarray): the pixels of the view.
+        """
+        rows = slice(self.top, self.top + self.height * step)
+        cols = slice(self.left, self.left + self.width * step)
+        values = self.maze[rows, cols][::step, ::step]
+
+        state = self.state[rows, cols]
+        height, width = -(-state.shape[0] // step), -(-state.shape[1] // step)
+        padded = np.zeros((height * step, width * step), dtype=np.uint8)
+        padded[:state.shape[0], :state.shape[1]] = state
+        state = padded.reshape(height, step, width, step).max(axis=(1, 3))
+
+        pixels = self.palette[state, values - self.WALL]
+        for position, value in ((self.start, self.PINOCCHIO), (self.goal, self.GEPETTO)):
+            row, col = (int(position[0]) - self.top) // step, (int(position[1]) - self.left) // step
+            if 0 <= row < height and 0 <= col < width:
+                pixels[row, col] = self.palette[0, value - self.WALL]
+        return pixels
+
+
+    def _draw_texts(self, image:Image.Image, zoom:int):
+        """
+        Writes the texts of the cells inside the view.
+
+        Args:
+            image (Image): the image of the view.
+            zoom (int): pixels per cell.
+        """
+        draw = ImageDraw.Draw(image)
+        rows, cols = math.ceil(self.height / zoom), math.ceil(self.width / zoom)
+        for row in range(self.top, self.top + rows):
+            for col in range(self.left, self.left + cols):
+                text = self.texts.get((row, col))
+                if text is not None:
+                    x, y = (col - self.left + 0.5) * zoom, (row - self.top + 0.5) * zoom
+                    draw.text((x, y), str(text), fill=(0, 0, 0), anchor='mm')
+
+
+    def _bind(self):
+        """
+        Binds the zoom, scroll and drag events of the canvas.
+        """
+        self.canvas.bind('<MouseWheel>', lambda event: self._wheel(event, 1 if event.delta > 0 else -1))
+        self.canvas.bind('<Button-4>', lambda event: self._wheel(event, 1))
+        self.canvas.bind('<Button-5>', lambda event: self._wheel(event, -1))
+        self.canvas.bind('<ButtonPress-1>', self._start_drag)
+        self.canvas.bind('<B1-Motion>', self._move_drag)
+
+
+    def _wheel(self, event, direction:int):
+        """
+        Zooms with Control, scrolls horizontally with Shift and vertically
+        otherwise.
+
+        Args:
+            event (Event): the wheel event.
+            direction (int): 1 for up and -1 for down.
+        """
+        if event.state & 0x4:
+            self.zoom_by(direction, event.x, event.y)
+        elif event.state & 0x1:
+            self.scroll_by(0, -direction * 100 / self.zoom)
+        else:
+            self.scroll_by(-direction * 100 / self.zoom, 0)
+
+
+    def _start_drag(self, event):
+        self.drag = (event.x, event.y, self.top, self.left)
+
+
+    def _move_drag(self, event):
+        x, y, top, left = self.drag
+        self.scroll_to(top - (event.y - y) / self.zoom, left - (event.x - x) / self.zoom)
+
+
+    @staticmethod
+    def _rgb(color:str) -> np.ndarray:
+        """
+        Args:
+            color (str): a color as '#RRGGBB'.
+
+        Returns:
+            (ndarray): the red, green and blue components.
+        """
+        return np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)], dtype=np.float32)
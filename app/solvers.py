@@ -0,0 +1,113 @@
+from astar import AStar
+from bfs import BFS
+from bidirectional import BidirectionalBFS, BidirectionalUCS
+from ids import IDS
+from jps import JPS
+from maze import Maze
+from tracer import Tracer
+from ucs import UCS
+
+
+
+# Search algorithms by name, with the class and the method that solves.
+ALGORITHMS = {
+    'bfs': (BFS, 'solve'),
+    'bfs_zigzag': (BFS, 'solve_zigzag'),
+    'ucs': (UCS, 'solve'),
+    'ids': (IDS, 'solve'),
+    'astar': (AStar, 'solve'),
+    'bfs_bidirectional': (BidirectionalBFS, 'solve'),
+    'ucs_bidirectional': (BidirectionalUCS, 'solve'),
+    'jps': (JPS, 'solve'),
+}
+
+
+
+class Result:
+    """
+    Class that represents the outcome of a search.
+    """
+
+    def __init__(self, path:list|str, visited:list, costs:dict|None=None):
+        """
+        Initializes the class instance.
+
+        Args:
+            path (list|str): path from the goal position to the start
+                             position, or a message if there is none.
+            visited (list): visited positions in order.
+            costs (dict): cost of the path to each reached position, for
+                          the algorithms that keep it.
+        """
+        self.path = path
+        self.visited = visited
+        self.costs = costs
+
+
+    @property
+    def found(self) -> bool:
+        """
+        Returns:
+            bool: True if a path was found.
+        """
+        return not isinstance(self.path, str)
+
+
+
+def solve(maze:Maze, algorithm:str, tracer:Tracer|None=None) -> Result:
+    """
+    Runs a search algorithm on a maze.
+
+    Args:
+        maze (Maze): Maze instance that represents the board.
+        algorithm (str): name of the algorithm, one of ALGORITHMS.
+        tracer (Tracer): observer of the search, or None.
+
+    Returns:
+        (Result): the path, the visited positions and the costs.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f'Unknown algorithm {algorithm!r}, expected one of {list(ALGORITHMS)}')
+
+    cls, method = ALGORITHMS[algorithm]
+    solver = cls(maze, tracer=tracer)
+    path = getattr(solver, method)()
+
+    return Result(path, solver.visited_list, getattr(solver, 'cost_so_far', None))
+
+
+
+def iterate(maze:Maze, algorithm:str):
+    """
+    Runs a search algorithm on a maze step by step.
+
+    Args:
+        maze (Maze): Maze instance that represents the board.
+        algorithm (str): name of the algorithm, one of ALGORITHMS.
+
+    Yields:
+        (tuple): the events of the search, see stream.stream.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f'Unknown algorithm {algorithm!r}, expected one of {list(ALGORITHMS)}')
+
+    cls, method = ALGORITHMS[algorithm]
+    return getattr(cls(maze), method.replace('solve', 'iterate'))()
+
+
+
+def path_cost(maze:Maze, path:list|str) -> int|None:
+    """
+    Computes the cost of a path, that is, the sum of the values of the
+    cells entered after the start.
+
+    Args:
+        maze (Maze): the maze where the path was found.
+        path (list): path from the goal position to the start position.
+
+    Returns:
+        (int): the cost of the path, or None if there is no path.
+    """
+    if isinstance(path, str):
+        return None
+    return sum(int(maze.maze[cell]) for cell in path[:-1])
@@ -0,0 +1,69 @@
+# Kinds of the events yielded while a search is followed.
+EXPAND = 'expand'
+VISIT = 'visit'
+PATH = 'path'
+
+
+
+def run(search) -> list|str:
+    """
+    Runs a search to its end.
+
+    Args:
+        search (generator): the search, that yields the expanded positions.
+
+    Returns:
+        (List): path from the goal position to the start position, or a
+                message if there is none.
+    """
+    try:
+        while True:
+            next(search)
+    except StopIteration as stop:
+        return stop.value
+
+
+
+def stream(solver, search):
+    """
+    Follows a search and yields its events as they happen. The positions
+    added to the visited list of the solver are yielded and dropped from
+    it, so the list only holds the ones of the last expansion.
+
+    Args:
+        solver (object): the solver that runs the search.
+        search (generator): the search, that yields the expanded positions.
+
+    Yields:
+        (tuple): the kind of event and its data, which is a position for
+                 EXPAND and VISIT events and the path, or a message if
+                 there is none, for the last PATH event.
+    """
+    while True:
+        try:
+            current = next(search)
+        except StopIteration as stop:
+            path = stop.value
+            break
+
+        yield (EXPAND, current)
+        yield from _drain(solver.visited_list)
+
+    yield from _drain(solver.visited_list)
+    yield (PATH, path)
+
+
+
+def _drain(visited:list):
+    """
+    Yields the positions of a visited list and empties it.
+
+    Args:
+        visited (list): the visited list of a solver.
+
+    Yields:
+        (tuple): a VISIT event for each position.
+    """
+    for position in visited:
+        yield (VISIT, position)
+    visited.clear()
@@ -0,0 +1,269 @@
+import os
+import tempfile
+
+import numpy as np
+
+from constant import Constant
+from maze import Maze
+
+
+
+class TiledSearch(Constant):
+    """
+    Base class for the searches that run on mazes larger than the memory.
+
+    The distance and the parent of every cell are kept in memory-mapped
+    scratch files instead of sets and dictionaries, so the memory only
+    holds the frontier. The search is Dial's algorithm run level by level:
+    the cells reached at each cost are expanded together with NumPy, and
+    they are sorted by the square tile they belong to, so the maze and the
+    scratch files are read one tile at a time in a predictable order.
+    """
+
+    # Define the possible moves: ↑, →, ↓, ←
+    MOVES = ((-1, 0), (0, 1), (1, 0), (0, -1))
+    WEIGHTED = True
+
+    def __init__(self, maze:Maze, tile:int=1024, directory:str|None=None):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (Maze): Maze instance that represents the board, usually
+                         created with mmap=True.
+            tile (int): side of the square tiles.
+            directory (str): directory for the scratch files, the system
+                             temporary directory by default.
+        """
+        if tile < 1:
+            raise ValueError('The tile side must be at least 1')
+
+        self.maze = maze.maze
+        self.start = maze.start
+        self.goal = maze.goal
+        self.tile = tile
+        self.directory = directory
+        self.rows, self.cols = self.maze.shape
+        self.scratch = None
+
+
+    def solve(self) -> list|str:
+        """
+        Implements Dial's algorithm over the tiles.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        self._initialize()
+
+        start = int(self.start[0]) * self.cols + int(self.start[1])
+        goal = int(self.goal[0]) * self.cols + int(self.goal[1])
+        distance = self.distance.reshape(-1)
+        distance[start] = 0
+
+        # Cells reached at each cost.
+        buckets = {0: [np.array([start])]}
+        current = 0
+
+        while buckets:
+            while current not in buckets:
+                current += 1
+
+            # A goal reached at this cost or less cannot get any cheaper.
+            if 0 <= distance[goal] <= current:
+                break
+
+            # Moves to a cell of cost 0 stay on the same level, so the
+            # bucket can grow while it is being processed.
+            while buckets.get(current):
+                cells = np.unique(np.concatenate(buckets.pop(current)))
+                cells = cells[distance[cells] == current]
+                if len(cells):
+                    self._expand(self._by_tile(cells), current, buckets)
+            buckets.pop(current, None)
+
+        self.distance.flush()
+        self.parent.flush()
+        return self._backtrack(start, goal)
+
+
+    def close(self):
+        """
+        Removes the scratch files.
+        """
+        if self.scratch is not None:
+            del self.distance, self.parent
+            self.scratch.cleanup()
+            self.scratch = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exception):
+        self.close()
+
+
+    @property
+    def expanded(self) -> int:
+        """
+        Returns:
+            (int): number of cells reached by the search.
+        """
+        return sum(
+            int(np.count_nonzero(self.distance[row:row + self.tile] >= 0))
+            for row in range(0, self.rows, self.tile)
+        )
+
+
+    @property
+    def visited_list(self) -> list[tuple[int, int]]:
+        """
+        Returns:
+            (List): positions reached by the search ordered by their cost.
+                    It is built from the scratch files, so it needs memory
+                    for all of them.
+        """
+        rows, cols = np.nonzero(self.distance >= 0)
+        order = np.argsort(self.distance[rows, cols], kind='stable')
+        return list(zip(rows[order].tolist(), cols[order].tolist()))
+
+
+    def _initialize(self):
+        """
+        Creates the scratch files for the distance of every cell, -1 while
+        it is not reached, and the move that reached it, -1 for none.
+        """
+        self.close()
+        self.scratch = tempfile.TemporaryDirectory(prefix='maze-', dir=self.directory)
+
+        shape = (self.rows, self.cols)
+        self.distance = np.memmap(os.path.join(self.scratch.name, 'distance'), np.int32, 'w+', shape=shape)
+        self.parent = np.memmap(os.path.join(self.scratch.name, 'parent'), np.int8, 'w+', shape=shape)
+
+        for row in range(0, self.rows, self.tile):
+            self.distance[row:row + self.tile] = -1
+            self.parent[row:row + self.tile] = -1
+
+
+    def _by_tile(self, cells:np.ndarray) -> np.ndarray:
+        """
+        Sorts cells by the tile they belong to, and by their position inside
+        each tile.
+
+        Args:
+            cells (ndarray): flat indices of the cells.
+
+        Returns:
+            (ndarray): the sorted cells.
+        """
+        rows, cols = np.divmod(cells, self.cols)
+        tiles = rows // self.tile * (self.cols // self.tile + 1) + cols // self.tile
+        return cells[np.lexsort((cells, tiles))]
+
+
+    def _expand(self, cells:np.ndarray, current:int, buckets:dict):
+        """
+        Expands the cells reached at the current cost and queues their
+        neighbors that get a cheaper path.
+
+        Args:
+            cells (ndarray): flat indices of the cells, sorted by tile.
+            current (int): the cost being expanded.
+            buckets (dict): arrays of cells pending to expand by cost.
+        """
+        maze = self.maze.reshape(-1)
+        distance = self.distance.reshape(-1)
+        parent = self.parent.reshape(-1)
+
+        rows, cols = np.divmod(cells, self.cols)
+        moves = np.array(self.MOVES)
+        neighbor_rows = (rows[:, None] + moves[:, 0]).ravel()
+        neighbor_cols = (cols[:, None] + moves[:, 1]).ravel()
+        directions = np.tile(np.arange(len(moves), dtype=np.int8), len(cells))
+
+        inside = (
+            (0 <= neighbor_rows) & (neighbor_rows < self.rows)
+            & (0 <= neighbor_cols) & (neighbor_cols < self.cols)
+        )
+        neighbors = neighbor_rows[inside] * self.cols + neighbor_cols[inside]
+        directions = directions[inside]
+
+        values = maze[neighbors].astype(np.int64)
+        passable = values != self.WALL
+        neighbors, directions, values = neighbors[passable], directions[passable], values[passable]
+
+        new_distance = current + (values if self.WEIGHTED else np.ones_like(values))
+        old_distance = distance[neighbors]
+        better = (old_distance < 0) | (new_distance < old_distance)
+        neighbors, directions, new_distance = neighbors[better], directions[better], new_distance[better]
+
+        # A cell reached from several cells keeps the first move, and the
+        # cost of all of them is the same, since it only depends on the cell.
+        neighbors, first = np.unique(neighbors, return_index=True)
+        directions, new_distance = directions[first], new_distance[first]
+
+        distance[neighbors] = new_distance
+        parent[neighbors] = directions
+
+        for cost in np.unique(new_distance).tolist():
+            buckets.setdefault(cost, []).append(neighbors[new_distance == cost])
+
+
+    def _backtrack(self, start:int, goal:int) -> list|str:
+        """
+        Follows the moves stored in the scratch file from the goal back to
+        the start.
+
+        Args:
+            start (int): flat index of Pinocchio's position.
+            goal (int): flat index of Gepetto's position.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        distance = self.distance.reshape(-1)
+        parent = self.parent.reshape(-1)
+        if distance[goal] < 0:
+            return 'No existe una solución'
+
+        path = [divmod(goal, self.cols)]
+        current = goal
+        while current != start:
+            row, col = self.MOVES[parent[current]]
+            current -= row * self.cols + col
+            path.append(divmod(current, self.cols))
+
+        return path
+
+
+
+class TiledBFS(TiledSearch):
+    """
+    Search over the tiles that counts the moves, so the path found has the
+    fewest moves like the one of BFS, although ties may be broken otherwise.
+    """
+
+    WEIGHTED = False
+
+
+
+class TiledUCS(TiledSearch):
+    """
+    Search over the tiles that adds the cost of the cells entered, so the
+    path found is optimal like the one of UCS.
+    """
+
+    WEIGHTED = True
+
+
+
+if __name__ == '__main__':
+
+    # Open the file with a matrix
+    maze = Maze('./data/matrix.txt')
+
+    # Find the path from the start to the goal
+    with TiledUCS(maze, tile=2) as ucs:
+        print("Solution UCS por bloques: ", ucs.solve())
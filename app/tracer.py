@@ -0,0 +1,180 @@
+import time
+
+
+
+class SearchCancelled(Exception):
+    """
+    Raised by a tracer to stop the search it observes.
+    """
+
+
+
+class Tracer:
+    """
+    Class that observes a search. The solvers call its methods while they
+    search, and this base class does nothing on any of them, so a subclass
+    only overrides the events it needs.
+
+    The solvers check if they have a tracer before calling it, so a search
+    without one does not pay for the calls.
+    """
+
+    def on_iteration(self, limit:int):
+        """
+        Called when an iteration of an iterative search starts.
+
+        Args:
+            limit (int): the depth limit of the iteration.
+        """
+
+
+    def on_expand(self, position:tuple[int, int], level:int):
+        """
+        Called when a position is taken out of the frontier to be expanded.
+
+        Args:
+            position (tuple): a specific position within the maze.
+            level (int): the level of the position in BFS, the cost of its
+                         path in UCS and A*, and its depth in IDS.
+        """
+
+
+    def on_push(self, position:tuple[int, int], frontier:int):
+        """
+        Called when a position is added to the frontier.
+
+        Args:
+            position (tuple): a specific position within the maze.
+            frontier (int): the size of the frontier after adding it.
+        """
+
+
+    def on_goal(self, position:tuple[int, int]):
+        """
+        Called when the goal is found.
+
+        Args:
+            position (tuple): the goal position.
+        """
+
+
+
+class CounterTracer(Tracer):
+    """
+    Class that counts the events of a search: the expanded and added
+    positions, the largest size of the frontier, the iterations and the
+    time spent on each level.
+    """
+
+    def __init__(self):
+        """
+        Initializes the class instance.
+        """
+        self.expanded = 0
+        self.pushed = 0
+        self.max_frontier = 0
+        self.iterations = 0
+        self.goal = None
+        self.level_times = {}   # seconds spent expanding each level
+        self._level = None
+        self._level_start = None
+
+
+    def on_iteration(self, limit:int):
+        self.iterations += 1
+        self._close_level()
+
+
+    def on_expand(self, position:tuple[int, int], level:int):
+        self.expanded += 1
+        if level != self._level:
+            self._close_level()
+            self._level = level
+            self._level_start = time.perf_counter()
+
+
+    def on_push(self, position:tuple[int, int], frontier:int):
+        self.pushed += 1
+        if frontier > self.max_frontier:
+            self.max_frontier = frontier
+
+
+    def on_goal(self, position:tuple[int, int]):
+        self.goal = position
+        self._close_level()
+
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            (Dict): the counters of the search.
+        """
+        self._close_level()
+        return {
+            'expanded': self.expanded,
+            'pushed': self.pushed,
+            'max_frontier': self.max_frontier,
+            'iterations': self.iterations,
+            'goal': self.goal,
+            'level_times': dict(self.level_times),
+        }
+
+
+    def _close_level(self):
+        """
+        Adds the time since the current level started to its total.
+        """
+        if self._level_start is not None:
+            elapsed = time.perf_counter() - self._level_start
+            self.level_times[self._level] = self.level_times.get(self._level, 0) + elapsed
+        self._level = None
+        self._level_start = None
+
+
+
+class ProgressTracer(Tracer):
+    """
+    Class that reports the progress of a search while it runs, and stops it
+    when it is cancelled. It is meant for searches run in another thread:
+    the report function and the cancel event are the only things shared.
+
+    The clock and the event are only checked every CHECK expansions, so
+    following the search costs little more than counting.
+    """
+
+    CHECK = 256
+
+    def __init__(self, report, cancel=None, interval:float=0.1):
+        """
+        Initializes the class instance.
+
+        Args:
+            report (callable): function called with the number of expanded
+                               positions and the size of the frontier.
+            cancel (Event): threading.Event that stops the search when set,
+                            or None.
+            interval (float): seconds between two reports.
+        """
+        self.report = report
+        self.cancel = cancel
+        self.interval = interval
+        self.expanded = 0
+        self.frontier = 0
+        self._last = time.perf_counter()
+
+
+    def on_expand(self, position:tuple[int, int], level:int):
+        self.expanded += 1
+        if self.expanded % self.CHECK:
+            return
+
+        if self.cancel is not None and self.cancel.is_set():
+            raise SearchCancelled()
+        now = time.perf_counter()
+        if now - self._last >= self.interval:
+            self._last = now
+            self.report(self.expanded, self.frontier)
+
+
+    def on_push(self, position:tuple[int, int], frontier:int):
+        self.frontier = frontier
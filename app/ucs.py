@@ -1,7 +1,11 @@
+from collections import deque
+from heapq import heappush, heappop
 from queue import PriorityQueue
 
 from constant import Constant
 from maze import Maze
+from stream import run, stream
+from tracer import Tracer
 
 
 
@@ -10,23 +14,159 @@ class UCS(Constant):
     Class that implements the Uniform-Cost Search algorithm.
     This algorithm is complete and optimal, meaning that it finds the
     shortest path if it exists.
+
+    The queue used by the search can be selected:
+        'heap': a binary heap with lazy deletion (default).
+        'bucket': Dial's algorithm, a bucket per cost, since the cost of
+                  entering a cell is a small integer.
+        'priority': the original queue.PriorityQueue implementation, that
+                    never relaxes a cell after it has been added.
     """
 
-    def __init__(self, maze:Maze):
+    ENGINES = ('heap', 'bucket', 'priority')
+
+    # Define the possible moves: ↑, →, ↓, ←
+    MOVES = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+    def __init__(self, maze:Maze, engine:str='heap', tracer:Tracer|None=None):
         """
         Initializes the class instance.
 
         Args:
             maze (Maze): Maze instance that represents the board.
+            engine (str): the queue used by the search, one of ENGINES.
+            tracer (Tracer): observer of the search, or None.
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f'Unknown engine {engine!r}, expected one of {self.ENGINES}')
+
         self.maze = maze.maze
         self.start = maze.start
         self.goal = maze.goal
+        self.cells, self.width = maze.grid.cells, maze.grid.width
+        self.engine = engine
+        self.tracer = tracer
 
 
     def solve(self) -> list|str:
         """
-        Implements the Uniform-Cost Search algorithm.
+        Implements the Uniform-Cost Search algorithm with the selected queue.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        return run(self._search())
+
+
+    def iterate(self):
+        """
+        Runs the Uniform-Cost Search algorithm step by step.
+
+        Yields:
+            (tuple): the events of the search, see stream.stream.
+        """
+        return stream(self, self._search())
+
+
+    def _search(self):
+        """
+        Returns:
+            (generator): the search with the selected queue, that yields
+                         every expanded position and returns the path.
+        """
+        if self.engine == 'heap':
+            return self._search_heap()
+        if self.engine == 'bucket':
+            return self._search_buckets()
+        return self._search_priority()
+
+
+    def _search_heap(self):
+        """
+        Implements Dijkstra's algorithm with a binary heap. A cell can be
+        added several times when a cheaper path to it is found, and the
+        outdated entries are skipped when they are taken out.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+
+        queue = [(0, self.start)]
+        push = lambda position, cost: heappush(queue, (cost, position))
+        tracer = self.tracer
+        if tracer is not None:
+            push = self._traced(push, queue.__len__)
+
+        while queue:
+            current_cost, current = heappop(queue)
+            if current in self.visited:
+                continue
+            self._mark_visited(current)
+            if tracer is not None:
+                tracer.on_expand(current, current_cost)
+            if self._is_goal(current):
+                if tracer is not None:
+                    tracer.on_goal(current)
+                break
+            self._relax_neighbors(current, current_cost, push)
+            yield current
+
+        return self._backtrack()
+
+
+    def _search_buckets(self):
+        """
+        Implements Dial's algorithm. The queue is a circular array of
+        buckets, one per cost, so adding and taking out a cell is O(1).
+        Since a move never costs more than the highest value of the maze,
+        that number of buckets plus one is enough.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+
+        buckets = [deque() for _ in range(int(self.maze.max()) + 1)]
+        pending = 0
+
+        def push(position, cost):
+            nonlocal pending
+            buckets[cost % len(buckets)].append(position)
+            pending += 1
+
+        tracer = self.tracer
+        if tracer is not None:
+            push = self._traced(push, lambda: pending)
+
+        push(self.start, 0)
+        current_cost = 0
+
+        while pending:
+            bucket = buckets[current_cost % len(buckets)]
+            while bucket:
+                current = bucket.popleft()
+                pending -= 1
+                if current in self.visited or self.cost_so_far[current] != current_cost:
+                    continue
+                self._mark_visited(current)
+                if tracer is not None:
+                    tracer.on_expand(current, current_cost)
+                if self._is_goal(current):
+                    if tracer is not None:
+                        tracer.on_goal(current)
+                    return self._backtrack()
+                self._relax_neighbors(current, current_cost, push)
+                yield current
+            current_cost += 1
+
+        return self._backtrack()
+
+
+    def _search_priority(self):
+        """
+        Implements the Uniform-Cost Search algorithm with queue.PriorityQueue.
+        The cells are marked as visited when they are added to the queue.
 
         Returns:
             (List): path from the start position to the end position.
@@ -37,11 +177,18 @@ class UCS(Constant):
         self._add_to_queue(self.start, 0)
         self._mark_visited(self.start)
 
+        tracer = self.tracer
+
         while not self.queue.empty():
             current_cost, current = self.queue.get()
+            if tracer is not None:
+                tracer.on_expand(current, current_cost)
             if self._is_goal(current):
+                if tracer is not None:
+                    tracer.on_goal(current)
                 break
             self._explore_neighbors(current, current_cost)
+            yield current
 
         return self._backtrack()
 
@@ -68,6 +215,28 @@ class UCS(Constant):
         """
         self.queue.put((cost, position))
 
+        if self.tracer is not None:
+            self.tracer.on_push(position, self.queue.qsize())
+
+
+    def _traced(self, push, frontier):
+        """
+        Wraps the function that adds a position to the queue so it also
+        reports it to the tracer. The queues are only wrapped when there is
+        a tracer, so the searches without one do not pay for it.
+
+        Args:
+            push (callable): adds a position with its cost to the queue.
+            frontier (callable): returns the size of the queue.
+
+        Returns:
+            (callable): the function that adds and reports a position.
+        """
+        def traced(position, cost):
+            push(position, cost)
+            self.tracer.on_push(position, frontier())
+        return traced
+
 
     def _explore_neighbors(self, current:tuple[int, int], current_cost:int):
         """
@@ -78,16 +247,13 @@ class UCS(Constant):
             current (tuple): a specific position within the maze.
             current_cost (int): the cost of the current path to reach this position.
         """
-        # Define the possible moves: ↑, →, ↓, ←
-        moves = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-
-        for move in moves:
+        for move in self.MOVES:
             # Calculates the next position according to the movement.
             next_pos = (current[0] + move[0], current[1] + move[1])
 
             if self._is_valid_position(next_pos):
                 # Calculate the cost of the new path and add it to the queue.
-                new_cost = current_cost + self.maze[next_pos]
+                new_cost = current_cost + self._cost(next_pos)
                 self._add_to_queue(next_pos, new_cost)
 
                 # Mark the cell as visited.
@@ -98,6 +264,31 @@ class UCS(Constant):
                 self.cost_so_far[next_pos] = new_cost
 
 
+    def _relax_neighbors(self, current:tuple[int, int], current_cost:int, push):
+        """
+        Updates the cost of the neighboring cells that can be reached with a
+        cheaper path through the current position.
+
+        Args:
+            current (tuple): a specific position within the maze.
+            current_cost (int): the cost of the path to reach this position.
+            push (callable): adds a position with its cost to the queue.
+        """
+        cells, width, visited, cost_so_far = self.cells, self.width, self.visited, self.cost_so_far
+
+        for move in self.MOVES:
+            next_pos = (current[0] + move[0], current[1] + move[1])
+
+            # The byte of the cell in Grid.cells.
+            cell = cells[(next_pos[0] + 1) * width + next_pos[1] + 1]
+            if cell and next_pos not in visited:
+                new_cost = current_cost + cell - 1
+                if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
+                    cost_so_far[next_pos] = new_cost
+                    self._set_parent(next_pos, current)
+                    push(next_pos, new_cost)
+
+
     def _is_valid_position(self, position:tuple[int, int]) -> bool:
         """
         Checks if a position is within the maze and is not an obstacle.
@@ -109,13 +300,22 @@ class UCS(Constant):
             (bool): True if the position is valid, False otherwise.
         """
         return (
-            (0 <= position[0] < self.maze.shape[0])
-            and (0 <= position[1] < self.maze.shape[1])
-            and position not in self.visited
-            and self.maze[position] != self.WALL
+            position not in self.visited
+            and self.cells[(position[0] + 1) * self.width + position[1] + 1]
         )
 
 
+    def _cost(self, position:tuple[int, int]) -> int:
+        """
+        Args:
+            position (tuple): a specific position within the maze.
+
+        Returns:
+            (int): the cost of entering the position.
+        """
+        return self.cells[(position[0] + 1) * self.width + position[1] + 1] - 1
+
+
     def _is_goal(self, position:tuple[int, int]) -> bool:
         """
         Checks if a position is the goal.
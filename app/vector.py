@@ -0,0 +1,205 @@
+import numpy as np
+
+from constant import Constant
+from maze import Maze
+
+
+
+class VectorBFS(Constant):
+    """
+    Class that implements a level-synchronous Breadth-First Search. Instead
+    of taking out one cell at a time from a queue, it expands the whole
+    frontier of a level at once with NumPy array operations.
+
+    The search runs on the padded grid of the maze, so the neighbors of every
+    cell of the frontier are found by adding the offset of each move. When
+    several cells of the frontier reach the same cell, the parent is the one
+    that BFS would have taken out of the queue first, so the paths and the
+    visited order are the same as in BFS.
+    """
+
+    def __init__(self, maze:Maze):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+        """
+        grid = self.grid = maze.grid
+        self.rows, self.cols = grid.rows, grid.cols
+        self.open = grid.codes != 0
+
+        self.start = grid.to_index(maze.start)
+        self.goal = grid.to_index(maze.goal)
+
+        # Define the possible moves: ↑, →, ↓, ←
+        self.offsets = np.array(grid.offsets)
+
+
+    def solve(self) -> list|str:
+        """
+        Implements the BFS algorithm expanding one level at a time.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        return self._solve(zigzag=False)
+
+
+    def solve_zigzag(self) -> list|str:
+        """
+        Implements the BFS algorithm in a zigzag pattern. Every level is
+        taken out in the reverse order in which it was reached, and the
+        moves are tried in reverse order on the odd levels, as BFS.solve_zigzag
+        does with its double-ended queue.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        return self._solve(zigzag=True)
+
+
+    def _solve(self, zigzag:bool) -> list|str:
+        """
+        Expands the frontier level by level until the goal is reached or
+        there are no more cells to visit.
+
+        Args:
+            zigzag (bool): True to take out the levels in a zigzag pattern.
+
+        Returns:
+            (List): path from the start position to the end position.
+        """
+        self._initialize()
+
+        frontier = np.array([self.start])
+        self.visited[self.start] = True
+        self.levels.append(frontier)
+
+        level = 0
+        while not self.visited[self.goal]:
+            moves = self._moves(level, zigzag)
+            frontier = self._expand(self._taken_out(frontier, level, zigzag), moves)
+            if not len(frontier):
+                break
+            level += 1
+            self.levels.append(frontier)
+
+        if self.visited[self.goal]:
+            # The search stops when the goal is taken out, so only the cells
+            # taken out before it in its level are expanded.
+            ordered = self._taken_out(frontier, level, zigzag)
+            before = ordered[:np.flatnonzero(ordered == self.goal)[0]]
+            self.levels.append(self._expand(before, self._moves(level, zigzag)))
+
+        return self._backtrack()
+
+
+    def _initialize(self):
+        """
+        Initializes the visited array, the parent directions and the list
+        with the cells reached in each level.
+        """
+        self.visited = np.zeros(self.open.shape, dtype=bool)
+        self.parent_dir = np.full(self.open.shape, -1, dtype=np.int8)
+        self.levels = []
+
+
+    def _moves(self, level:int, zigzag:bool) -> np.ndarray:
+        """
+        Returns the order in which the moves are tried in a given level.
+
+        Args:
+            level (int): the level that is expanded.
+            zigzag (bool): True if the levels are taken out in zigzag.
+
+        Returns:
+            (ndarray): indices of the moves in self.offsets.
+        """
+        if zigzag and level % 2:
+            return np.array([3, 2, 1, 0])
+        return np.array([0, 1, 2, 3])
+
+
+    def _taken_out(self, cells:np.ndarray, level:int, zigzag:bool) -> np.ndarray:
+        """
+        Returns the cells of a level in the order they are taken out.
+
+        Args:
+            cells (ndarray): cells of the level in the order they were reached.
+            level (int): the level of the cells.
+            zigzag (bool): True if the levels are taken out in zigzag.
+
+        Returns:
+            (ndarray): the cells in the order they are expanded.
+        """
+        if zigzag and level > 0:
+            return cells[::-1]
+        return cells
+
+
+    def _expand(self, frontier:np.ndarray, moves:np.ndarray) -> np.ndarray:
+        """
+        Visits the neighbors of all the cells of a frontier at once.
+
+        Args:
+            frontier (ndarray): cells in the order they are expanded.
+            moves (ndarray): indices of the moves in the order they are tried.
+
+        Returns:
+            (ndarray): the new cells in the order they were reached.
+        """
+        # Row i holds the neighbors of the i-th cell, so the flattened order
+        # is the order in which a queue would have reached them.
+        candidates = (frontier[:, None] + self.offsets[moves]).ravel()
+        keys = np.flatnonzero(self.open[candidates] & ~self.visited[candidates])
+
+        # Keep only the first time each cell is reached.
+        _, first = np.unique(candidates[keys], return_index=True)
+        keys = keys[np.sort(first)]
+
+        cells = candidates[keys]
+        self.visited[cells] = True
+        self.parent_dir[cells] = moves[keys % len(moves)]
+        return cells
+
+
+    @property
+    def visited_list(self) -> list[tuple[int, int]]:
+        """
+        Returns:
+            (List): visited positions in the order they were reached.
+        """
+        return self.grid.to_positions(np.concatenate(self.levels))
+
+
+    def _backtrack(self) -> list|str:
+        """
+        Backtrack from the goal to the start following the parent directions.
+
+        Returns:
+            (List): path from the goal position to the start position.
+        """
+        if not self.visited[self.goal]:
+            return 'No existe una solución'
+
+        path = [self.goal]
+        current = self.goal
+
+        while current != self.start:
+            current -= int(self.offsets[self.parent_dir[current]])
+            path.append(current)
+
+        return self.grid.to_positions(np.array(path))
+
+
+
+if __name__ == '__main__':
+
+    # Open the file with a matrix
+    maze = Maze('./data/matrix.txt')
+
+    # Find the path from the start to the goal
+    bfs = VectorBFS(maze)
+    print("Solution BFS normal: ", bfs.solve())
+    print("Solution BFS intercalado: ", bfs.solve_zigzag())
@@ -0,0 +1,101 @@
+import queue
+import threading
+
+from maze import Maze
+from solvers import solve
+from tracer import ProgressTracer, SearchCancelled
+
+
+
+class SearchWorker:
+    """
+    Class that runs a search in a background thread, so the window that
+    starts it keeps answering. The thread only talks to the window through
+    a queue of messages, which the window reads with poll() from its own
+    thread, usually from a callback scheduled with after():
+
+        (PROGRESS, expanded, frontier): the search is still running.
+        (DONE, result): the search ended with a Result.
+        (CANCELLED,): the search was stopped by cancel().
+        (ERROR, exception): the search failed.
+
+    The last message is always DONE, CANCELLED or ERROR.
+    """
+
+    PROGRESS = 'progress'
+    DONE = 'done'
+    CANCELLED = 'cancelled'
+    ERROR = 'error'
+
+    def __init__(self, maze:Maze, algorithm:str, interval:float=0.1):
+        """
+        Initializes the class instance.
+
+        Args:
+            maze (Maze): Maze instance that represents the board.
+            algorithm (str): name of the algorithm, one of solvers.ALGORITHMS.
+            interval (float): seconds between two progress messages.
+        """
+        self.maze = maze
+        self.algorithm = algorithm
+        self.messages = queue.Queue()
+        self.cancelled = threading.Event()
+        self.tracer = ProgressTracer(self._report, self.cancelled, interval)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+
+    def start(self):
+        """
+        Starts the search.
+        """
+        self.thread.start()
+
+
+    def cancel(self):
+        """
+        Asks the search to stop. It stops at its next check, and then sends
+        the CANCELLED message.
+        """
+        self.cancelled.set()
+
+
+    @property
+    def running(self) -> bool:
+        """
+        Returns:
+            bool: True while the search thread is alive.
+        """
+        return self.thread.is_alive()
+
+
+    def poll(self) -> list[tuple]:
+        """
+        Takes the messages sent since the last call, without waiting.
+
+        Returns:
+            (List): the messages in the order they were sent.
+        """
+        messages = []
+        while True:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                return messages
+
+
+    def _report(self, expanded:int, frontier:int):
+        self.messages.put((self.PROGRESS, expanded, frontier))
+
+
+    def _run(self):
+        """
+        Runs the search and sends its outcome.
+        """
+        try:
+            result = solve(self.maze, self.algorithm, self.tracer)
+        except SearchCancelled:
+            self.messages.put((self.CANCELLED,))
+        except Exception as error:
+            self.messages.put((self.ERROR, error))
+        else:
+            self.messages.put((self.DONE, result))